@@ -0,0 +1,37 @@
+"""make decision_rules table_id FK deferrable
+
+Revision ID: d4e6f8a0b1c2
+Revises: 1c2d3e4f5a6b
+Create Date: 2026-02-21 09:40:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e6f8a0b1c2"
+down_revision: Union[str, None] = "1c2d3e4f5a6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Deferrable so bulk loaders can SET CONSTRAINTS ALL DEFERRED and have
+    # the decision_rules.table_id -> decision_tables.id check run once at
+    # COMMIT instead of per row. INITIALLY IMMEDIATE keeps the default
+    # per-statement behaviour for everything else.
+    op.execute(
+        "ALTER TABLE decision_rules "
+        "ALTER CONSTRAINT decision_rules_table_id_fkey "
+        "DEFERRABLE INITIALLY IMMEDIATE"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE decision_rules "
+        "ALTER CONSTRAINT decision_rules_table_id_fkey "
+        "NOT DEFERRABLE"
+    )
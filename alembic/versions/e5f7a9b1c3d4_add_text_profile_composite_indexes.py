@@ -0,0 +1,55 @@
+"""add composite indexes for text profile hot paths
+
+Revision ID: e5f7a9b1c3d4
+Revises: d4e6f8a0b1c2
+Create Date: 2026-02-21 10:15:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f7a9b1c3d4"
+down_revision: Union[str, None] = "d4e6f8a0b1c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches the composite indexes declared on the ORM models so existing
+    # databases get the same index-backed lookups as fresh create_all ones.
+    op.create_index(
+        "ix_text_profile_obj_active",
+        "text_profile",
+        ["object_type", "is_active"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_text_profile_rule_obj_active",
+        "text_profile_rule",
+        ["object_type", "is_active"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_profile_text_map_profile_active_seq",
+        "profile_text_map",
+        ["profile_id", "is_active", "sequence"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_profile_text_value_map_active",
+        "profile_text_value",
+        ["profile_text_map_id", "is_active"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profile_text_value_map_active", table_name="profile_text_value")
+    op.drop_index(
+        "ix_profile_text_map_profile_active_seq", table_name="profile_text_map"
+    )
+    op.drop_index("ix_text_profile_rule_obj_active", table_name="text_profile_rule")
+    op.drop_index("ix_text_profile_obj_active", table_name="text_profile")
@@ -215,6 +215,14 @@ class Settings(BaseModel):
         os.getenv("TEXT_PROFILE_AUDIT_ENABLED"), False
     )
 
+    # Decision attribute-key source for text profile contexts:
+    # false => prefer the local attribute registry; call the decision engine
+    #          only when the registry has no keys for the object type.
+    # true  => always fetch attribute keys from the decision engine.
+    TEXT_PROFILE_FORCE_REMOTE_METADATA: bool = _as_bool(
+        os.getenv("TEXT_PROFILE_FORCE_REMOTE_METADATA"), False
+    )
+
     # Mass change cockpit switch:
     # false => mass change endpoints return 404 (feature dark).
     # true  => dataset listing/template/validate/submit endpoints enabled.
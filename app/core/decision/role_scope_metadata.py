@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import json
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
 from time import monotonic
@@ -118,8 +119,39 @@ DEFAULT_ROLE_SCOPE_METADATA: dict[str, Any] = {
     ],
 }
 
+@dataclass(frozen=True)
+class RoleScopeMetadataSnapshot:
+    """Immutable, preprocessed view of the role-scope metadata payload.
+
+    Built once per cache fill so per-request consumers can read the shape
+    flags and policy/mapping sequences without deep-copying the raw dict.
+    Callers must treat the contained dicts as read-only; anything that needs
+    a mutable payload should go through ``get_role_scope_metadata()``.
+    """
+
+    raw: dict[str, Any] = field(repr=False)
+    is_v2: bool
+    shape_valid: bool
+    endpoint_policies: tuple[dict[str, Any], ...]
+    role_scope_mapping: tuple[dict[str, Any], ...]
+
+
+def build_role_scope_metadata_snapshot(raw: dict[str, Any]) -> RoleScopeMetadataSnapshot:
+    is_v2 = "role_scope_mapping" in raw
+    raw_policies = raw.get("endpoint_policies") or []
+    raw_mapping = raw.get("role_scope_mapping") or []
+    shape_valid = isinstance(raw_policies, list) and isinstance(raw_mapping, list)
+    return RoleScopeMetadataSnapshot(
+        raw=raw,
+        is_v2=is_v2,
+        shape_valid=shape_valid,
+        endpoint_policies=tuple(raw_policies) if shape_valid else (),
+        role_scope_mapping=tuple(raw_mapping) if shape_valid else (),
+    )
+
+
 _CACHE_LOCK = Lock()
-_CACHE_VALUE: dict[str, Any] | None = None
+_CACHE_SNAPSHOT: RoleScopeMetadataSnapshot | None = None
 _CACHE_SOURCE: str = ""
 _CACHE_EXPIRES_AT: float = 0.0
 
@@ -141,32 +173,32 @@ def _db_read_enabled() -> bool:
     return bool(settings.METADATA_FRAMEWORK_ENABLED) and _normalized_read_mode() == "db"
 
 
-def _cache_get(source: str) -> dict[str, Any] | None:
+def _cache_get_snapshot(source: str) -> RoleScopeMetadataSnapshot | None:
     now = monotonic()
     with _CACHE_LOCK:
         if source != _CACHE_SOURCE:
             return None
         if now >= _CACHE_EXPIRES_AT:
             return None
-        if _CACHE_VALUE is None:
-            return None
-        return copy.deepcopy(_CACHE_VALUE)
+        return _CACHE_SNAPSHOT
 
 
-def _cache_put(source: str, value: dict[str, Any]) -> None:
+def _cache_put(source: str, value: dict[str, Any]) -> RoleScopeMetadataSnapshot:
     ttl = _cache_ttl_seconds()
     now = monotonic()
+    snapshot = build_role_scope_metadata_snapshot(copy.deepcopy(value))
     with _CACHE_LOCK:
-        global _CACHE_VALUE, _CACHE_SOURCE, _CACHE_EXPIRES_AT
+        global _CACHE_SNAPSHOT, _CACHE_SOURCE, _CACHE_EXPIRES_AT
         _CACHE_SOURCE = source
-        _CACHE_VALUE = copy.deepcopy(value)
+        _CACHE_SNAPSHOT = snapshot
         _CACHE_EXPIRES_AT = now + ttl if ttl > 0 else now
+    return snapshot
 
 
 def reset_role_scope_metadata_cache() -> None:
     with _CACHE_LOCK:
-        global _CACHE_VALUE, _CACHE_SOURCE, _CACHE_EXPIRES_AT
-        _CACHE_VALUE = None
+        global _CACHE_SNAPSHOT, _CACHE_SOURCE, _CACHE_EXPIRES_AT
+        _CACHE_SNAPSHOT = None
         _CACHE_SOURCE = ""
         _CACHE_EXPIRES_AT = 0.0
 
@@ -228,31 +260,32 @@ def _load_metadata_from_db() -> dict[str, Any] | None:
     return payload
 
 
-def get_role_scope_metadata() -> dict[str, Any]:
+def get_role_scope_metadata_snapshot() -> RoleScopeMetadataSnapshot:
     if _db_read_enabled():
-        cached_db = _cache_get("db")
+        cached_db = _cache_get_snapshot("db")
         if cached_db is not None:
             return cached_db
 
         loaded_db = _load_metadata_from_db()
         if loaded_db is not None:
-            _cache_put("db", loaded_db)
-            return copy.deepcopy(loaded_db)
+            return _cache_put("db", loaded_db)
 
     configured_path = settings.ROLE_SCOPE_METADATA_PATH
     if configured_path:
         cache_key = f"file:{configured_path}"
-        cached_file = _cache_get(cache_key)
+        cached_file = _cache_get_snapshot(cache_key)
         if cached_file is not None:
             return cached_file
 
         loaded = _load_metadata_from_file(configured_path)
         if loaded is not None:
-            _cache_put(cache_key, loaded)
-            return copy.deepcopy(loaded)
+            return _cache_put(cache_key, loaded)
 
-    cached_default = _cache_get("default")
+    cached_default = _cache_get_snapshot("default")
     if cached_default is not None:
         return cached_default
-    _cache_put("default", DEFAULT_ROLE_SCOPE_METADATA)
-    return copy.deepcopy(DEFAULT_ROLE_SCOPE_METADATA)
+    return _cache_put("default", DEFAULT_ROLE_SCOPE_METADATA)
+
+
+def get_role_scope_metadata() -> dict[str, Any]:
+    return copy.deepcopy(get_role_scope_metadata_snapshot().raw)
@@ -88,7 +88,12 @@ class DecisionRule(Base):
     )
     table_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("decision_tables.id", ondelete="CASCADE"),
+        ForeignKey(
+            "decision_tables.id",
+            ondelete="CASCADE",
+            deferrable=True,
+            initially="IMMEDIATE",
+        ),
         nullable=False,
     )
     priority: Mapped[int] = mapped_column(nullable=False, server_default=text("0"))
@@ -4,6 +4,7 @@ from sqlalchemy import (
     Boolean,
     Date,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -20,6 +21,7 @@ class TextProfile(AuditMixin, Base):
     __tablename__ = "text_profile"
     __table_args__ = (
         UniqueConstraint("name", "object_type", name="uq_text_profile_name_object"),
+        Index("ix_text_profile_obj_active", "object_type", "is_active"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -50,6 +52,9 @@ class TextProfile(AuditMixin, Base):
 
 class TextProfileRule(AuditMixin, Base):
     __tablename__ = "text_profile_rule"
+    __table_args__ = (
+        Index("ix_text_profile_rule_obj_active", "object_type", "is_active"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     object_type: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
@@ -82,6 +87,7 @@ class ProfileTextMap(AuditMixin, Base):
     __tablename__ = "profile_text_map"
     __table_args__ = (
         UniqueConstraint("profile_id", "text_type_id", name="uq_profile_text_map_profile_type"),
+        Index("ix_profile_text_map_profile_active_seq", "profile_id", "is_active", "sequence"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -131,6 +137,9 @@ class ProfileTextMap(AuditMixin, Base):
 
 class ProfileTextValue(AuditMixin, Base):
     __tablename__ = "profile_text_value"
+    __table_args__ = (
+        Index("ix_profile_text_value_map_active", "profile_text_map_id", "is_active"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     profile_text_map_id: Mapped[int] = mapped_column(
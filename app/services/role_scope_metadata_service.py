@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from fnmatch import fnmatchcase
 from typing import Any
 
 from sqlalchemy.orm import Session
 
-from app.core.decision.role_scope_metadata import get_role_scope_metadata
+from app.core.decision.role_scope_metadata import (
+    RoleScopeMetadataSnapshot,
+    get_role_scope_metadata_snapshot,
+)
 from app.models.company_master import CompanyMaster
 from app.models.customer_master import CustomerMaster
 from app.models.partner_master import PartnerMaster
@@ -17,11 +21,11 @@ from app.models.user_partner_link import UserPartnerLink
 from app.services.role_scope_policy_validator import validate_role_scope_policy_payload
 from app.services.user_scope_service import resolve_union_scope_ids
 
-_FORWARDER_CODES = {"FO", "FORWARDER"}
-_SUPPLIER_CODES = {"SU", "SUPPLIER"}
+_FORWARDER_CODES = frozenset({"FO", "FORWARDER"})
+_SUPPLIER_CODES = frozenset({"SU", "SUPPLIER"})
 
 
-@dataclass
+@dataclass(slots=True)
 class MetadataScopeDecision:
     allow: bool
     scope_by_field: dict[str, set[int]]
@@ -69,6 +73,27 @@ def _normalize_endpoint_path(path: str | None) -> str:
     return normalized
 
 
+_GLOB_CHARS = "*?[]"
+
+
+def _has_glob_chars(value: str) -> bool:
+    return any(ch in value for ch in _GLOB_CHARS)
+
+
+def _glob_match(value: str, pattern: str) -> bool:
+    """Match ``value`` against a glob ``pattern``.
+
+    Policy globs are almost always plain "prefix*" (or occasionally
+    "*suffix") shapes, so specialize those to string ops and only fall back
+    to fnmatchcase for full glob syntax.
+    """
+    if pattern.endswith("*") and not _has_glob_chars(pattern[:-1]):
+        return value.startswith(pattern[:-1])
+    if pattern.startswith("*") and not _has_glob_chars(pattern[1:]):
+        return value.endswith(pattern[1:])
+    return fnmatchcase(value, pattern)
+
+
 def _method_matches(policy_method: str | None, actual_method: str | None) -> bool:
     if not policy_method:
         return True
@@ -84,8 +109,8 @@ def _path_matches(policy_path: str | None, actual_path: str | None) -> bool:
     normalized_actual = _normalize_endpoint_path(actual_path)
     if not normalized_actual:
         return False
-    if any(ch in normalized_policy for ch in "*?[]"):
-        return fnmatchcase(normalized_actual, normalized_policy)
+    if _has_glob_chars(normalized_policy):
+        return _glob_match(normalized_actual, normalized_policy)
     return normalized_policy == normalized_actual
 
 
@@ -96,13 +121,13 @@ def _endpoint_key_matches(pattern: str | None, endpoint_key: str | None) -> bool
     rhs = endpoint_key.strip().lower()
     if lhs == rhs:
         return True
-    if any(ch in lhs for ch in "*?[]"):
-        return fnmatchcase(rhs, lhs)
+    if _has_glob_chars(lhs):
+        return _glob_match(rhs, lhs)
     return False
 
 
 def _match_policy(
-    endpoint_policies: list[dict[str, Any]],
+    endpoint_policies: tuple[dict[str, Any], ...] | list[dict[str, Any]],
     *,
     endpoint_key: str | None,
     http_method: str | None,
@@ -134,51 +159,94 @@ def _match_policy(
     return None
 
 
-def _is_partner_role_match(role_code: str | None, role_name: str | None, target: str | None) -> bool:
-    normalized_target = (target or "").strip().upper()
-    if not normalized_target:
+def _partner_role_target(target: str | None) -> tuple[str, str]:
+    """Normalize a partner-role filter once, outside any per-row loop."""
+    target_upper = (target or "").strip().upper()
+    if not target_upper:
+        return "", "any"
+    if target_upper in _SUPPLIER_CODES:
+        return target_upper, "supplier"
+    if target_upper in _FORWARDER_CODES:
+        return target_upper, "forwarder"
+    return target_upper, "other"
+
+
+def _is_partner_role_match(
+    role_code: str | None,
+    role_name: str | None,
+    *,
+    target_upper: str,
+    target_category: str,
+) -> bool:
+    if target_category == "any":
         return True
 
     code = (role_code or "").strip().upper()
     name = (role_name or "").strip().upper()
-    if normalized_target in _SUPPLIER_CODES:
+    if target_category == "supplier":
         return code in _SUPPLIER_CODES or name == "SUPPLIER"
-    if normalized_target in _FORWARDER_CODES:
+    if target_category == "forwarder":
         return code in _FORWARDER_CODES or name == "FORWARDER"
-    return code == normalized_target or name == normalized_target
+    return code == target_upper or name == target_upper
+
+
+def _customer_company_rows(
+    db: Session, *, user_email: str
+) -> list[tuple[int | None, int | None, bool | None]]:
+    """Fetch the user's active customer links with their company in one query.
+
+    Serves both the customer_id and company_id source branches so a request
+    resolving both dimensions issues a single round-trip instead of two
+    overlapping multi-way joins.
+    """
+    return (
+        db.query(
+            UserCustomerLink.customer_id,
+            CustomerMaster.company_id,
+            CompanyMaster.is_active,
+        )
+        .join(CustomerMaster, CustomerMaster.id == UserCustomerLink.customer_id)
+        .outerjoin(CompanyMaster, CompanyMaster.id == CustomerMaster.company_id)
+        .filter(UserCustomerLink.user_email == user_email)
+        .filter(UserCustomerLink.deletion_indicator == False)
+        .filter(CustomerMaster.is_active == True)
+        .all()
+    )
 
 
-def _resolve_ids_from_source(db: Session, *, user_email: str, source: str) -> set[int]:
+def _resolve_ids_from_source(
+    db: Session,
+    *,
+    user_email: str,
+    source: str,
+    query_cache: dict[str, Any] | None = None,
+) -> set[int]:
     source_normalized = " ".join((source or "").strip().split())
     source_lower = source_normalized.lower()
     if not source_lower:
         return set()
 
-    if source_lower.startswith("user_customer_link.customer_id"):
-        rows = (
-            db.query(UserCustomerLink.customer_id)
-            .join(CustomerMaster, CustomerMaster.id == UserCustomerLink.customer_id)
-            .filter(UserCustomerLink.user_email == user_email)
-            .filter(UserCustomerLink.deletion_indicator == False)
-            .filter(CustomerMaster.is_active == True)
-            .all()
-        )
-        return {int(row[0]) for row in rows if row and row[0] is not None}
-
-    if source_lower.startswith("user_customer_link.company_id"):
-        rows = (
-            db.query(CustomerMaster.company_id)
-            .select_from(UserCustomerLink)
-            .join(CustomerMaster, CustomerMaster.id == UserCustomerLink.customer_id)
-            .join(CompanyMaster, CompanyMaster.id == CustomerMaster.company_id)
-            .filter(UserCustomerLink.user_email == user_email)
-            .filter(UserCustomerLink.deletion_indicator == False)
-            .filter(CustomerMaster.is_active == True)
-            .filter(CustomerMaster.company_id.isnot(None))
-            .filter(CompanyMaster.is_active == True)
-            .all()
-        )
-        return {int(row[0]) for row in rows if row and row[0] is not None}
+    if source_lower.startswith(
+        ("user_customer_link.customer_id", "user_customer_link.company_id")
+    ):
+        rows = None
+        if query_cache is not None:
+            rows = query_cache.get("customer_company_rows")
+        if rows is None:
+            rows = _customer_company_rows(db, user_email=user_email)
+            if query_cache is not None:
+                query_cache["customer_company_rows"] = rows
+        if source_lower.startswith("user_customer_link.customer_id"):
+            return {
+                int(customer_id)
+                for customer_id, _, _ in rows
+                if customer_id is not None
+            }
+        return {
+            int(company_id)
+            for _, company_id, company_active in rows
+            if company_id is not None and company_active
+        }
 
     if source_lower.startswith("user_partner_link.partner_id"):
         partner_role_filter: str | None = None
@@ -189,6 +257,7 @@ def _resolve_ids_from_source(db: Session, *, user_email: str, source: str) -> se
         )
         if match:
             partner_role_filter = match.group(1).strip()
+        target_upper, target_category = _partner_role_target(partner_role_filter)
 
         rows = (
             db.query(
@@ -206,7 +275,12 @@ def _resolve_ids_from_source(db: Session, *, user_email: str, source: str) -> se
         for partner_id, role_code, role_name in rows:
             if partner_id is None:
                 continue
-            if _is_partner_role_match(role_code, role_name, partner_role_filter):
+            if _is_partner_role_match(
+                role_code,
+                role_name,
+                target_upper=target_upper,
+                target_category=target_category,
+            ):
                 resolved.add(int(partner_id))
         return resolved
 
@@ -218,10 +292,16 @@ def _resolve_v2_scope_by_field(
     *,
     user_email: str,
     role_names: set[str],
-    role_scope_mapping: list[dict[str, Any]],
+    role_scope_mapping: tuple[dict[str, Any], ...] | list[dict[str, Any]],
     scope_dimensions: set[str],
 ) -> dict[str, set[int]]:
     scope_by_field: dict[str, set[int]] = {}
+    # Several mappings (e.g. one per role) often point at the same source;
+    # resolve each distinct source once per request instead of re-querying.
+    # query_cache additionally shares fetched rows between source branches
+    # that read the same tables (customer_id/company_id).
+    ids_by_source: dict[str, set[int]] = {}
+    query_cache: dict[str, Any] = {}
     for mapping in role_scope_mapping:
         if not isinstance(mapping, dict):
             continue
@@ -238,7 +318,12 @@ def _resolve_v2_scope_by_field(
         source = (mapping.get("source") or "").strip()
         if not source:
             continue
-        ids = _resolve_ids_from_source(db, user_email=user_email, source=source)
+        ids = ids_by_source.get(source)
+        if ids is None:
+            ids = _resolve_ids_from_source(
+                db, user_email=user_email, source=source, query_cache=query_cache
+            )
+            ids_by_source[source] = ids
         if not ids:
             continue
 
@@ -255,19 +340,18 @@ def _resolve_v2_scope_by_field(
 def _resolve_v2_decision(
     db: Session,
     *,
-    metadata: dict[str, Any],
+    metadata: RoleScopeMetadataSnapshot,
     user_email: str,
     endpoint_key: str | None,
     http_method: str | None,
     endpoint_path: str | None,
 ) -> MetadataScopeDecision:
-    endpoint_policies = metadata.get("endpoint_policies") or []
-    role_scope_mapping = metadata.get("role_scope_mapping") or []
-    if not isinstance(endpoint_policies, list) or not isinstance(role_scope_mapping, list):
+    if not metadata.shape_valid:
         return MetadataScopeDecision(allow=True, scope_by_field={}, reason="invalid_metadata")
+    role_scope_mapping = metadata.role_scope_mapping
 
     policy = _match_policy(
-        endpoint_policies,
+        metadata.endpoint_policies,
         endpoint_key=endpoint_key,
         http_method=http_method,
         endpoint_path=endpoint_path,
@@ -276,10 +360,20 @@ def _resolve_v2_decision(
         return MetadataScopeDecision(allow=True, scope_by_field={}, reason="no_policy")
 
     policy_id = (policy.get("id") or "").strip() or None
-    union_scope = resolve_union_scope_ids(db, user_email)
-    role_names = set(union_scope.role_names)
 
+    # Resolve the user's union scope lazily: policies with no role gating and
+    # a non-union scope_mode never need the underlying link-table queries.
     bypass_roles = _normalize_roles(policy.get("bypass_roles"))
+    allowed_roles_any = _normalize_roles(policy.get("allowed_roles_any"))
+    required_roles_all = _normalize_roles(policy.get("required_roles_all"))
+
+    union_scope = None
+    role_names: set[str] = set()
+    if bypass_roles or allowed_roles_any or required_roles_all:
+        union_scope = resolve_union_scope_ids(db, user_email)
+        # Read-only below (isdisjoint/issubset checks); no defensive copy needed.
+        role_names = union_scope.role_names
+
     if bypass_roles and not role_names.isdisjoint(bypass_roles):
         return MetadataScopeDecision(
             allow=True,
@@ -289,7 +383,6 @@ def _resolve_v2_decision(
             bypass=True,
         )
 
-    allowed_roles_any = _normalize_roles(policy.get("allowed_roles_any"))
     if allowed_roles_any and role_names.isdisjoint(allowed_roles_any):
         return MetadataScopeDecision(
             allow=False,
@@ -298,7 +391,6 @@ def _resolve_v2_decision(
             reason="allowed_roles_any_failed",
         )
 
-    required_roles_all = _normalize_roles(policy.get("required_roles_all"))
     if required_roles_all and not required_roles_all.issubset(role_names):
         return MetadataScopeDecision(
             allow=False,
@@ -310,7 +402,7 @@ def _resolve_v2_decision(
     scoped_validation_errors = validate_role_scope_policy_payload(
         {
             "endpoint_policies": [policy],
-            "role_scope_mapping": role_scope_mapping,
+            "role_scope_mapping": list(role_scope_mapping),
         },
         required_endpoint_keys=None,
     )
@@ -328,7 +420,7 @@ def _resolve_v2_decision(
             allow=True,
             scope_by_field={},
             matched_policy_id=policy_id,
-            reason=f"scope_mode_{scope_mode}",
+            reason=sys.intern(f"scope_mode_{scope_mode}"),
         )
 
     scope_dimensions = {
@@ -336,6 +428,9 @@ def _resolve_v2_decision(
         for value in (policy.get("scope_dimensions") or [])
         if str(value).strip()
     }
+    if union_scope is None:
+        union_scope = resolve_union_scope_ids(db, user_email)
+        role_names = union_scope.role_names
     scope_by_field = _resolve_v2_scope_by_field(
         db,
         user_email=user_email,
@@ -405,7 +500,7 @@ def _resolve_v1_dimension_maps(db: Session, user_email: str) -> dict[str, dict[s
             customer_ids_by_code[code.lower()] = int(customer_id)
 
     return {
-        "role_name": {"roles": set(union_scope.role_names)},
+        "role_name": {"roles": union_scope.role_names},
         "forwarder_code": {
             "ids": set(union_scope.forwarder_partner_ids),
             "ids_by_code": forwarder_ids_by_code,
@@ -427,16 +522,15 @@ def _resolve_v1_dimension_maps(db: Session, user_email: str) -> dict[str, dict[s
 def _resolve_v1_decision(
     db: Session,
     *,
-    metadata: dict[str, Any],
+    metadata: RoleScopeMetadataSnapshot,
     user_email: str,
     endpoint_key: str | None,
 ) -> MetadataScopeDecision:
-    endpoint_policies = metadata.get("endpoint_policies") or []
-    if not isinstance(endpoint_policies, list):
+    if not metadata.shape_valid:
         return MetadataScopeDecision(allow=True, scope_by_field={}, reason="invalid_metadata")
 
     policy = _match_policy(
-        endpoint_policies,
+        metadata.endpoint_policies,
         endpoint_key=endpoint_key,
         http_method=None,
         endpoint_path=None,
@@ -450,7 +544,7 @@ def _resolve_v1_decision(
         return MetadataScopeDecision(allow=True, scope_by_field={}, reason="no_clauses")
 
     dimension_maps = _resolve_v1_dimension_maps(db, user_email)
-    role_names = set(dimension_maps.get("role_name", {}).get("roles") or set())
+    role_names = dimension_maps.get("role_name", {}).get("roles") or set()
     scope_by_field: dict[str, set[int]] = {}
     for clause in clauses:
         if not isinstance(clause, dict):
@@ -501,8 +595,8 @@ def resolve_metadata_scope_decision(
     http_method: str | None,
     endpoint_path: str | None,
 ) -> MetadataScopeDecision:
-    metadata = get_role_scope_metadata()
-    if "role_scope_mapping" in metadata:
+    metadata = get_role_scope_metadata_snapshot()
+    if metadata.is_v2:
         return _resolve_v2_decision(
             db,
             metadata=metadata,
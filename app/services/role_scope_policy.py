@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import logging
 import random
-from fnmatch import fnmatchcase
 
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.services.role_scope_metadata_service import resolve_metadata_scope_decision
+from app.services.role_scope_metadata_service import (
+    _glob_match,
+    resolve_metadata_scope_decision,
+)
 from app.services.user_scope_service import (
     resolve_legacy_precedence_scope_ids,
     resolve_union_scope_ids,
@@ -23,8 +25,14 @@ _SCOPE_DENY_REASON_CODES = {
     "empty_resolved_scope_for_scoped_endpoint": 2,
     "invalid_metadata_contract": 3,
 }
-_SCOPE_DENY_REASON_BY_CODE = {
-    code: reason for reason, code in _SCOPE_DENY_REASON_CODES.items()
+_SCOPE_DENY_DETAIL_DEFAULT = "Access denied by role-scope policy"
+_SCOPE_DENY_DETAIL_BY_CODE = {
+    _SCOPE_DENY_REASON_CODES["empty_resolved_scope_for_scoped_endpoint"]: (
+        "Access denied by role-scope policy: empty resolved scope for scoped endpoint"
+    ),
+    _SCOPE_DENY_REASON_CODES["invalid_metadata_contract"]: (
+        "Access denied by role-scope policy: invalid scoped metadata contract"
+    ),
 }
 
 
@@ -47,27 +55,62 @@ def _endpoint_in_rollout(endpoint_key: str | None) -> bool:
     if not endpoint_key:
         return False
     candidate = endpoint_key.strip().lower()
-    return any(fnmatchcase(candidate, pattern) for pattern in patterns)
+    return any(_glob_match(candidate, pattern) for pattern in patterns)
+
 
+# Sampling threshold scaled to 32 random bits; recomputed only when the
+# configured rate changes, so the common path is one int comparison.
+_AUDIT_SAMPLE_BITS = 32
+_AUDIT_SAMPLE_SCALE = 1 << _AUDIT_SAMPLE_BITS
+_audit_sample_cache: tuple[object, int] = (None, _AUDIT_SAMPLE_SCALE)
 
-def _audit_sample_rate() -> float:
-    rate = settings.ROLE_SCOPE_AUDIT_SAMPLE_RATE
+
+def _audit_sample_threshold() -> int:
+    global _audit_sample_cache
+    raw_rate = settings.ROLE_SCOPE_AUDIT_SAMPLE_RATE
+    cached_raw, cached_threshold = _audit_sample_cache
+    if raw_rate == cached_raw:
+        return cached_threshold
     try:
-        value = float(rate)
+        value = float(raw_rate)
     except Exception:
         value = 1.0
-    return max(0.0, min(1.0, value))
+    value = max(0.0, min(1.0, value))
+    threshold = int(value * _AUDIT_SAMPLE_SCALE)
+    _audit_sample_cache = (raw_rate, threshold)
+    return threshold
 
 
 def _should_emit_audit_log() -> bool:
     if not settings.ROLE_SCOPE_AUDIT_ENABLED:
         return False
-    sample_rate = _audit_sample_rate()
-    if sample_rate <= 0:
+    threshold = _audit_sample_threshold()
+    if threshold <= 0:
         return False
-    if sample_rate >= 1:
+    if threshold >= _AUDIT_SAMPLE_SCALE:
         return True
-    return random.random() <= sample_rate
+    return random.getrandbits(_AUDIT_SAMPLE_BITS) <= threshold
+
+
+class _LazyScopeRepr:
+    """Defers sorting scope ids until the log record is actually formatted.
+
+    Verbose audit lines can carry thousands of ids per field; sorting them
+    eagerly would pay O(n log n) even when the record is dropped by a logger
+    level or filter downstream.
+    """
+
+    __slots__ = ("_scope_by_field",)
+
+    def __init__(self, scope_by_field: dict[str, set[int]]) -> None:
+        self._scope_by_field = scope_by_field
+
+    def __repr__(self) -> str:
+        return repr(
+            {field: sorted(ids) for field, ids in self._scope_by_field.items()}
+        )
+
+    __str__ = __repr__
 
 
 def _audit_scope_resolution(
@@ -79,6 +122,8 @@ def _audit_scope_resolution(
 ) -> None:
     if not _should_emit_audit_log():
         return
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
     scope_sizes = {field: len(ids) for field, ids in scope_by_field.items()}
     logger.info(
@@ -86,7 +131,7 @@ def _audit_scope_resolution(
         endpoint_key or "-",
         user_email or "-",
         mode,
-        sorted(scope_by_field.keys()),
+        sorted(scope_by_field),
         scope_sizes,
     )
     if settings.ROLE_SCOPE_AUDIT_VERBOSE:
@@ -94,7 +139,7 @@ def _audit_scope_resolution(
             "role_scope_decision_scope endpoint=%s user=%s scope=%s",
             endpoint_key or "-",
             user_email or "-",
-            {field: sorted(ids) for field, ids in scope_by_field.items()},
+            _LazyScopeRepr(scope_by_field),
         )
 
 
@@ -128,17 +173,13 @@ def is_scope_denied(scope_by_field: dict[str, set[int]] | None) -> bool:
 
 def scope_deny_detail(scope_by_field: dict[str, set[int]] | None) -> str:
     if not is_scope_denied(scope_by_field):
-        return "Access denied by role-scope policy"
-    reason_codes = scope_by_field.get(_SCOPE_DENY_REASON_FIELD) or set()
-    reason = None
-    if reason_codes:
-        reason = _SCOPE_DENY_REASON_BY_CODE.get(next(iter(reason_codes)))
-
-    if reason == "empty_resolved_scope_for_scoped_endpoint":
-        return "Access denied by role-scope policy: empty resolved scope for scoped endpoint"
-    if reason == "invalid_metadata_contract":
-        return "Access denied by role-scope policy: invalid scoped metadata contract"
-    return "Access denied by role-scope policy"
+        return _SCOPE_DENY_DETAIL_DEFAULT
+    reason_codes = scope_by_field.get(_SCOPE_DENY_REASON_FIELD)
+    if not reason_codes:
+        return _SCOPE_DENY_DETAIL_DEFAULT
+    return _SCOPE_DENY_DETAIL_BY_CODE.get(
+        next(iter(reason_codes)), _SCOPE_DENY_DETAIL_DEFAULT
+    )
 
 
 def sanitize_scope_by_field(scope_by_field: dict[str, set[int]] | None) -> dict[str, set[int]]:
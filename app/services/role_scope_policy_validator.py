@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any
-
-_FORWARDER_CODES = {"FO", "FORWARDER"}
-_SUPPLIER_CODES = {"SU", "SUPPLIER"}
+from functools import lru_cache
+from typing import AbstractSet, Any
 
 REQUIRED_BUSINESS_ENDPOINT_KEYS: frozenset[str] = frozenset(
     {
@@ -29,216 +27,334 @@ REQUIRED_BUSINESS_ENDPOINT_KEYS: frozenset[str] = frozenset(
     }
 )
 
-BUYER_SCOPED_ENDPOINT_KEYS: frozenset[str] = frozenset(
-    {
-        "purchase_orders",
-        "purchase_orders.create",
-        "purchase_orders.initialization_data",
-        "purchase_orders.schedule_lines_merge",
-        "purchase_orders.text_profile.resolve",
-        "purchase_orders.texts.update",
-        "shipments.from_schedule_lines",
-        "shipments.create",
-        "shipments.text_profile.resolve",
-        "shipments.list",
-        "shipments.workspace",
-        "shipments.read",
-        "shipments.delete",
-        "shipments.texts.update",
-        "reports.po_to_group",
-        "reports.visibility",
-        "reports.metadata",
-        "reports.visibility.metadata",
-    }
+_REQUIRED_BUSINESS_ENDPOINT_KEYS_SORTED: tuple[str, ...] = tuple(
+    sorted(REQUIRED_BUSINESS_ENDPOINT_KEYS)
 )
 
+# Currently every required business endpoint is buyer-scoped; alias rather
+# than duplicating the literal so the sets cannot drift apart silently.
+BUYER_SCOPED_ENDPOINT_KEYS: frozenset[str] = REQUIRED_BUSINESS_ENDPOINT_KEYS
+
+
+@lru_cache(maxsize=256)
+def _normalize_roles_cached(values: tuple) -> frozenset[str]:
+    return frozenset(
+        stripped.upper()
+        for value in values
+        if value is not None and (stripped := str(value).strip())
+    )
+
+
+@lru_cache(maxsize=256)
+def _normalize_dimensions_cached(values: tuple) -> frozenset[str]:
+    return frozenset(
+        stripped
+        for value in values
+        if value is not None and (stripped := str(value).strip())
+    )
+
 
-def _normalize_roles(values: Any) -> set[str]:
+def _normalize_roles(values: Any) -> frozenset[str]:
     if values is None:
-        return set()
+        return _EMPTY_FROZENSET
     if isinstance(values, str):
-        values = [values]
+        values = (values,)
     if not isinstance(values, (list, tuple, set)):
-        return set()
-    return {
-        str(value).strip().upper()
-        for value in values
-        if value is not None and str(value).strip()
-    }
+        return _EMPTY_FROZENSET
+    try:
+        return _normalize_roles_cached(tuple(values))
+    except TypeError:  # unhashable elements; normalize without the cache
+        return frozenset(
+            stripped.upper()
+            for value in values
+            if value is not None and (stripped := str(value).strip())
+        )
 
 
-def _normalize_dimensions(values: Any) -> set[str]:
+def _normalize_dimensions(values: Any) -> frozenset[str]:
     if values is None:
-        return set()
+        return _EMPTY_FROZENSET
     if isinstance(values, str):
-        values = [values]
+        values = (values,)
     if not isinstance(values, (list, tuple, set)):
-        return set()
-    return {
-        str(value).strip()
-        for value in values
-        if value is not None and str(value).strip()
-    }
+        return _EMPTY_FROZENSET
+    try:
+        return _normalize_dimensions_cached(tuple(values))
+    except TypeError:
+        return frozenset(
+            stripped
+            for value in values
+            if value is not None and (stripped := str(value).strip())
+        )
 
 
 def _normalize_endpoint_key(value: Any) -> str:
     return str(value or "").strip().lower()
 
 
+_WS_RE = re.compile(r"\s+")
+
+
 def _normalized_source(value: Any) -> str:
-    return " ".join(str(value or "").strip().split())
+    text = str(value or "")
+    if not text:
+        return ""
+    # Well-formed sources have no runs of whitespace; skip the collapse.
+    if "  " not in text and "\t" not in text and "\n" not in text:
+        return text.strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
-def _parse_partner_role(source: str) -> str | None:
-    match = re.search(
-        r"where\s+partner_role\s*=\s*['\"]?([A-Za-z0-9_\- ]+)['\"]?",
-        source,
-        flags=re.IGNORECASE,
-    )
+_EMPTY_FROZENSET: frozenset[str] = frozenset()
+
+_PARTNER_ROLE_RE = re.compile(
+    r"where\s+partner_role\s*=\s*['\"]?([A-Za-z0-9_\- ]+)['\"]?",
+    re.IGNORECASE,
+)
+
+
+def _parse_partner_role(source: str, source_lower: str | None = None) -> str | None:
+    # Cheap substring prefilter: most sources carry no where-clause at all,
+    # so reject them without touching the regex engine.
+    haystack = source_lower if source_lower is not None else source.lower()
+    if "partner_role" not in haystack:
+        return None
+    match = _PARTNER_ROLE_RE.search(source)
     if not match:
         return None
     token = match.group(1).strip().upper()
     return token or None
 
 
+# Known "table.column" source tokens with a single compatible dimension;
+# the partner-link source is handled separately because its dimension
+# depends on the parsed partner_role filter.
+_SOURCE_TOKEN_DIMENSION = {
+    "user_customer_link.customer_id": "customer_id",
+    "user_customer_link.company_id": "company_id",
+}
+_PARTNER_LINK_SOURCE_TOKEN = "user_partner_link.partner_id"
+
+# Partner-role token to its compatible dimension; one dict probe replaces
+# membership tests against the supplier and forwarder code sets.
+_PARTNER_ROLE_DIMENSION = {
+    "SU": "vendor_id",
+    "SUPPLIER": "vendor_id",
+    "FO": "forwarder_id",
+    "FORWARDER": "forwarder_id",
+}
+_PARTNER_LINK_DIMENSIONS = frozenset({"vendor_id", "forwarder_id"})
+
+
 def is_source_dimension_compatible(*, dimension: str, source: str) -> bool:
     dimension_value = str(dimension or "").strip()
     source_normalized = _normalized_source(source)
-    source_lower = source_normalized.lower()
-
-    if not dimension_value or not source_lower:
+    if not dimension_value or not source_normalized:
         return False
+    return _compat_cached(dimension_value, source_normalized)
 
-    if source_lower.startswith("user_customer_link.customer_id"):
-        return dimension_value == "customer_id"
 
-    if source_lower.startswith("user_customer_link.company_id"):
-        return dimension_value == "company_id"
+@lru_cache(maxsize=512)
+def _compat_cached(dimension_value: str, source_normalized: str) -> bool:
+    """Compatibility core memoized on normalized (dimension, source) pairs.
 
-    if source_lower.startswith("user_partner_link.partner_id"):
-        partner_role = _parse_partner_role(source_normalized)
-        if partner_role in _SUPPLIER_CODES:
-            return dimension_value == "vendor_id"
-        if partner_role in _FORWARDER_CODES:
-            return dimension_value == "forwarder_id"
-        return dimension_value in {"vendor_id", "forwarder_id"}
+    The same pair typically repeats across many role_scope_mapping rows, so
+    the token split and partner-role parse run once per unique pair.
+    """
+    source_lower = source_normalized.lower()
+    source_token = source_lower.split(" ", 1)[0]
+    expected_dimension = _SOURCE_TOKEN_DIMENSION.get(source_token)
+    if expected_dimension is not None:
+        return dimension_value == expected_dimension
+
+    if source_token == _PARTNER_LINK_SOURCE_TOKEN:
+        partner_role = _parse_partner_role(source_normalized, source_lower)
+        expected_dimension = (
+            _PARTNER_ROLE_DIMENSION.get(partner_role) if partner_role else None
+        )
+        if expected_dimension is not None:
+            return dimension_value == expected_dimension
+        return dimension_value in _PARTNER_LINK_DIMENSIONS
 
     return False
 
 
-def validate_role_scope_policy_payload(
-    payload: dict[str, Any],
-    *,
-    required_endpoint_keys: set[str] | frozenset[str] | None = REQUIRED_BUSINESS_ENDPOINT_KEYS,
-) -> list[str]:
-    errors: list[str] = []
-    if not isinstance(payload, dict):
-        return ["Payload must be a JSON object."]
-
-    endpoint_policies = payload.get("endpoint_policies")
-    role_scope_mapping = payload.get("role_scope_mapping")
-    if not isinstance(endpoint_policies, list):
-        errors.append("endpoint_policies must be a list.")
-        endpoint_policies = []
-    if not isinstance(role_scope_mapping, list):
-        errors.append("role_scope_mapping must be a list.")
-        role_scope_mapping = []
-
-    role_to_dimensions: dict[str, set[str]] = {}
-    for idx, raw in enumerate(role_scope_mapping):
-        if not isinstance(raw, dict):
-            errors.append(f"role_scope_mapping[{idx}] must be an object.")
-            continue
-        role = str(raw.get("role") or "").strip().upper()
-        dimension = str(raw.get("dimension") or "").strip()
-        source = _normalized_source(raw.get("source"))
-
-        if not role:
-            errors.append(f"role_scope_mapping[{idx}] role is required.")
-            continue
-        if not dimension:
-            errors.append(f"role_scope_mapping[{idx}] dimension is required.")
-            continue
-        if not source:
-            errors.append(f"role_scope_mapping[{idx}] source is required.")
-            continue
-        if not is_source_dimension_compatible(dimension=dimension, source=source):
-            errors.append(
-                "role_scope_mapping[%s] incompatible source/dimension pair: "
-                "dimension='%s', source='%s'."
-                % (idx, dimension, source)
+def _invert_role_dimensions(
+    role_to_dimensions: dict[str, set[str]]
+) -> dict[str, set[str]]:
+    roles_by_dimension: dict[str, set[str]] = {}
+    for role, dimensions in role_to_dimensions.items():
+        for dimension in dimensions:
+            roles_by_dimension.setdefault(dimension, set()).add(role)
+    return roles_by_dimension
+
+
+class RoleScopePolicyValidator:
+    """Reusable payload validator with coverage derivatives precomputed.
+
+    Instantiating once and calling ``validate`` repeatedly amortizes the
+    frozenset coercion and pre-sorting of the required endpoint keys across
+    calls; the module-level ``validate_role_scope_policy_payload`` wrapper
+    keeps the existing one-shot API.
+    """
+
+    __slots__ = ("_required_keys", "_required_keys_sorted")
+
+    def __init__(
+        self,
+        required_endpoint_keys: AbstractSet[str] | None = REQUIRED_BUSINESS_ENDPOINT_KEYS,
+    ) -> None:
+        if required_endpoint_keys is None:
+            self._required_keys: frozenset[str] | None = None
+            self._required_keys_sorted: tuple[str, ...] = ()
+        elif required_endpoint_keys is REQUIRED_BUSINESS_ENDPOINT_KEYS:
+            self._required_keys = REQUIRED_BUSINESS_ENDPOINT_KEYS
+            self._required_keys_sorted = _REQUIRED_BUSINESS_ENDPOINT_KEYS_SORTED
+        else:
+            self._required_keys = frozenset(required_endpoint_keys)
+            self._required_keys_sorted = tuple(sorted(self._required_keys))
+
+    def validate(self, payload: dict[str, Any]) -> list[str]:
+        errors: list[str] = []
+        if not isinstance(payload, dict):
+            return ["Payload must be a JSON object."]
+
+        endpoint_policies = payload.get("endpoint_policies")
+        role_scope_mapping = payload.get("role_scope_mapping")
+        if not isinstance(endpoint_policies, list):
+            errors.append("endpoint_policies must be a list.")
+            endpoint_policies = []
+        if not isinstance(role_scope_mapping, list):
+            errors.append("role_scope_mapping must be a list.")
+            role_scope_mapping = []
+
+        role_to_dimensions: dict[str, set[str]] = {}
+        for idx, raw in enumerate(role_scope_mapping):
+            if not isinstance(raw, dict):
+                errors.append(f"role_scope_mapping[{idx}] must be an object.")
+                continue
+            role = str(raw.get("role") or "").strip().upper()
+            dimension = str(raw.get("dimension") or "").strip()
+            source = _normalized_source(raw.get("source"))
+
+            if not role:
+                errors.append(f"role_scope_mapping[{idx}] role is required.")
+                continue
+            if not dimension:
+                errors.append(f"role_scope_mapping[{idx}] dimension is required.")
+                continue
+            if not source:
+                errors.append(f"role_scope_mapping[{idx}] source is required.")
+                continue
+            if not is_source_dimension_compatible(dimension=dimension, source=source):
+                errors.append(
+                    "role_scope_mapping[%s] incompatible source/dimension pair: "
+                    "dimension='%s', source='%s'."
+                    % (idx, dimension, source)
+                )
+                continue
+
+            role_to_dimensions.setdefault(role, set()).add(dimension)
+
+        # Inverted index so each policy resolves roles in O(|scope_dimensions|)
+        # instead of scanning every mapped role. Built lazily: payloads without
+        # union-mode scoped policies never consult it.
+        roles_by_dimension: dict[str, set[str]] | None = None
+
+        enforce_business_coverage = self._required_keys is not None
+        # Accumulated during the single policy pass below; the missing-keys
+        # check runs once after the loop instead of in a separate traversal.
+        enabled_endpoint_keys: set[str] = set()
+
+        for idx, raw in enumerate(endpoint_policies):
+            if not isinstance(raw, dict):
+                errors.append(f"endpoint_policies[{idx}] must be an object.")
+                continue
+            enabled_flag = raw.get("enabled", True)
+            # Normalized once per policy; reused for coverage tracking and the
+            # buyer-scoped check further down.
+            endpoint_key = _normalize_endpoint_key(raw.get("endpoint"))
+            if enforce_business_coverage and enabled_flag:
+                enabled_endpoint_keys.add(endpoint_key)
+            if enabled_flag is False:
+                continue
+
+            scope_mode = str(raw.get("scope_mode") or "union").strip().lower()
+            if scope_mode != "union":
+                continue
+
+            scope_dimensions = _normalize_dimensions(raw.get("scope_dimensions"))
+            if not scope_dimensions:
+                continue
+
+            policy_id = str(raw.get("id") or f"index:{idx}").strip()
+            allowed_roles_any = _normalize_roles(raw.get("allowed_roles_any"))
+            required_roles_all = _normalize_roles(raw.get("required_roles_all"))
+            explicit_roles = allowed_roles_any or required_roles_all
+
+            if not explicit_roles and not role_to_dimensions:
+                errors.append(
+                    f"Policy {policy_id} declares scoped dimensions but has no resolvable roles."
+                )
+                continue
+
+            if roles_by_dimension is None:
+                roles_by_dimension = _invert_role_dimensions(role_to_dimensions)
+
+            if explicit_roles:
+                has_resolvable_role = any(
+                    not roles_by_dimension.get(dimension, _EMPTY_FROZENSET).isdisjoint(
+                        explicit_roles
+                    )
+                    for dimension in scope_dimensions
+                )
+            else:
+                has_resolvable_role = any(
+                    dimension in roles_by_dimension for dimension in scope_dimensions
+                )
+            if not has_resolvable_role:
+                errors.append(
+                    "Policy %s has scoped dimensions %s but no allowed role can resolve them."
+                    % (policy_id, sorted(scope_dimensions))
+                )
+                continue
+
+            buyer_scoped = (
+                enforce_business_coverage and endpoint_key in BUYER_SCOPED_ENDPOINT_KEYS
             )
-            continue
+            if buyer_scoped and "customer_id" not in scope_dimensions:
+                errors.append(
+                    "Policy %s (%s) must include customer_id in scope_dimensions."
+                    % (policy_id, endpoint_key or "unknown-endpoint")
+                )
 
-        role_to_dimensions.setdefault(role, set()).add(dimension)
+        if enforce_business_coverage:
+            # Iterate the pre-sorted tuple so the error message comes out
+            # ordered without a per-call sort.
+            missing = [
+                key
+                for key in self._required_keys_sorted
+                if key not in enabled_endpoint_keys
+            ]
+            if missing:
+                errors.append(
+                    "Missing required endpoint policies: %s." % ", ".join(missing)
+                )
 
-    enforce_business_coverage = required_endpoint_keys is not None
+        return errors
 
-    if enforce_business_coverage:
-        enabled_endpoint_keys = {
-            _normalize_endpoint_key(raw.get("endpoint"))
-            for raw in endpoint_policies
-            if isinstance(raw, dict) and raw.get("enabled", True)
-        }
-        missing_keys = sorted(
-            key for key in required_endpoint_keys if key not in enabled_endpoint_keys
-        )
-        if missing_keys:
-            errors.append(
-                "Missing required endpoint policies: %s."
-                % ", ".join(missing_keys)
-            )
 
-    for idx, raw in enumerate(endpoint_policies):
-        if not isinstance(raw, dict):
-            errors.append(f"endpoint_policies[{idx}] must be an object.")
-            continue
-        if raw.get("enabled", True) is False:
-            continue
-
-        scope_mode = str(raw.get("scope_mode") or "union").strip().lower()
-        if scope_mode != "union":
-            continue
-
-        scope_dimensions = _normalize_dimensions(raw.get("scope_dimensions"))
-        if not scope_dimensions:
-            continue
-
-        policy_id = str(raw.get("id") or f"index:{idx}").strip()
-        endpoint_key = _normalize_endpoint_key(raw.get("endpoint"))
-        allowed_roles_any = _normalize_roles(raw.get("allowed_roles_any"))
-        required_roles_all = _normalize_roles(raw.get("required_roles_all"))
-        candidate_roles = (
-            allowed_roles_any or required_roles_all or set(role_to_dimensions.keys())
-        )
+_DEFAULT_VALIDATOR = RoleScopePolicyValidator()
+_NO_COVERAGE_VALIDATOR = RoleScopePolicyValidator(required_endpoint_keys=None)
 
-        if not candidate_roles:
-            errors.append(
-                f"Policy {policy_id} declares scoped dimensions but has no resolvable roles."
-            )
-            continue
-
-        matching_roles = [
-            role
-            for role in sorted(candidate_roles)
-            if role_to_dimensions.get(role, set()) & scope_dimensions
-        ]
-        if not matching_roles:
-            errors.append(
-                "Policy %s has scoped dimensions %s but no allowed role can resolve them."
-                % (policy_id, sorted(scope_dimensions))
-            )
-            continue
-
-        if (
-            enforce_business_coverage
-            and
-            endpoint_key in BUYER_SCOPED_ENDPOINT_KEYS
-            and "customer_id" not in scope_dimensions
-        ):
-            errors.append(
-                "Policy %s (%s) must include customer_id in scope_dimensions."
-                % (policy_id, endpoint_key or "unknown-endpoint")
-            )
 
-    return errors
+def validate_role_scope_policy_payload(
+    payload: dict[str, Any],
+    *,
+    required_endpoint_keys: AbstractSet[str] | None = REQUIRED_BUSINESS_ENDPOINT_KEYS,
+) -> list[str]:
+    if required_endpoint_keys is REQUIRED_BUSINESS_ENDPOINT_KEYS:
+        return _DEFAULT_VALIDATOR.validate(payload)
+    if required_endpoint_keys is None:
+        return _NO_COVERAGE_VALIDATOR.validate(payload)
+    return RoleScopePolicyValidator(required_endpoint_keys).validate(payload)
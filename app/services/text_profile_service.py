@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from sqlalchemy import case, func, literal, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -29,8 +38,44 @@ from app.services.decision_engine_client import evaluate as evaluate_decision
 
 logger = logging.getLogger(__name__)
 
+# The audit flag comes from the environment and never changes after startup;
+# snapshotting it keeps the disabled _audit path to a single truthiness test.
+_AUDIT_ENABLED = settings.TEXT_PROFILE_AUDIT_ENABLED
+
+# Decision-engine attribute keys change rarely; cache successful fetches
+# per object type so the hot resolve path does not block on HTTP each call.
+_ATTR_KEYS_TTL_SECONDS = 300
+_ATTR_KEYS_LOCK = Lock()
+_ATTR_KEYS_CACHE: dict[str, tuple[float, set[str]]] = {}
+
+# Shared session with pooled keep-alive connections so metadata fetches skip
+# the per-call TCP/TLS handshake to the decision engine.
+_DE_SESSION = requests.Session()
+_DE_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+_DE_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+
+# Runs the decision-engine HTTP evaluation while the caller thread works the
+# DB fallback; only the HTTP call moves off-thread, the Session never does.
+_DECISION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="text-profile-decision"
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ResolvedTextRow:
     text_type_id: int
     text_type_code: str | None
@@ -42,7 +87,7 @@ class ResolvedTextRow:
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedTextProfile:
     profile_id: int | None
     profile_name: str | None
@@ -57,16 +102,23 @@ def _today() -> date:
     return date.today()
 
 
+_UND_TO_DASH = str.maketrans("_", "-")
+
+
+# Both normalizers are pure and see a tiny domain of locale/country codes,
+# so repeated calls on ranking paths become a single cached dict hit.
+@lru_cache(maxsize=256)
 def _normalize_language(value: str | None) -> str:
-    raw = (value or "").strip().lower()
-    if not raw:
+    if not value:
         return "en"
-    return raw.replace("_", "-")
+    return value.strip().lower().translate(_UND_TO_DASH) or "en"
 
 
+@lru_cache(maxsize=256)
 def _normalize_country(value: str | None) -> str | None:
-    raw = (value or "").strip().upper()
-    return raw or None
+    if not value:
+        return None
+    return value.strip().upper() or None
 
 
 def _is_effective_on(
@@ -217,34 +269,27 @@ class TextProfileService:
         if not user_email:
             return ("en", None)
 
-        user = db.query(User).filter(User.email == user_email).first()
-        if user is None:
+        user_row = db.query(User.id).filter(User.email == user_email).first()
+        if user_row is None:
             return ("en", None)
+        user_id = int(user_row[0])
 
-        attrs = (
-            db.query(UserAttribute)
-            .filter(UserAttribute.user_id == user.id)
+        language_row = (
+            db.query(UserAttribute.value)
+            .filter(UserAttribute.user_id == user_id)
             .filter(UserAttribute.key.in_(["preferred_language", "language"]))
-            .all()
-        )
-        language: str | None = None
-        for key in ("preferred_language", "language"):
-            row = next(
-                (
-                    attr
-                    for attr in attrs
-                    if (attr.key or "").strip().lower() == key
-                    and (attr.value or "").strip()
-                ),
-                None,
+            .filter(func.trim(func.coalesce(UserAttribute.value, "")) != "")
+            .order_by(
+                case((UserAttribute.key == "preferred_language", 0), else_=1),
+                UserAttribute.id.asc(),
             )
-            if row is not None:
-                language = row.value
-                break
+            .first()
+        )
+        language = language_row[0] if language_row else None
 
         country_row = (
             db.query(UserCountry.country_code)
-            .filter(UserCountry.user_id == user.id)
+            .filter(UserCountry.user_id == user_id)
             .order_by(UserCountry.id.asc())
             .first()
         )
@@ -289,6 +334,75 @@ class TextProfileService:
 
         return None
 
+    @staticmethod
+    def _resolve_text_type_id_cached(
+        db: Session,
+        cache: dict[tuple[Any, str, str], int | None],
+        *,
+        text_type_id: int | None = None,
+        text_type_code: str | None = None,
+        text_type_name: str | None = None,
+    ) -> int | None:
+        """resolve_text_type_id with a caller-scoped memo.
+
+        Payload batches typically repeat the same code/name; keying on the
+        raw triple turns O(rows) lookups into O(unique keys).
+        """
+        key = (text_type_id, text_type_code or "", text_type_name or "")
+        if key in cache:
+            return cache[key]
+        resolved = TextProfileService.resolve_text_type_id(
+            db,
+            text_type_id=text_type_id,
+            text_type_code=text_type_code,
+            text_type_name=text_type_name,
+        )
+        cache[key] = resolved
+        return resolved
+
+    @staticmethod
+    def _load_text_type_index(
+        db: Session,
+        *,
+        ids: set[int],
+        codes: set[str],
+        names: set[str],
+    ) -> tuple[
+        dict[int, tuple[int, str | None, str | None]],
+        dict[str, tuple[int, str | None, str | None]],
+        dict[str, tuple[int, str | None, str | None]],
+    ]:
+        """Load all candidate text types in one SELECT, keyed by id/code/name."""
+        by_id: dict[int, tuple[int, str | None, str | None]] = {}
+        by_code: dict[str, tuple[int, str | None, str | None]] = {}
+        by_name: dict[str, tuple[int, str | None, str | None]] = {}
+        clauses = []
+        if ids:
+            clauses.append(TextTypeLookup.id.in_(ids))
+        if codes:
+            clauses.append(TextTypeLookup.text_type_code.in_(codes))
+        if names:
+            clauses.append(TextTypeLookup.text_type_name.in_(names))
+        if not clauses:
+            return (by_id, by_code, by_name)
+        rows = (
+            db.query(
+                TextTypeLookup.id,
+                TextTypeLookup.text_type_code,
+                TextTypeLookup.text_type_name,
+            )
+            .filter(or_(*clauses))
+            .all()
+        )
+        for row_id, row_code, row_name in rows:
+            entry = (int(row_id), row_code, row_name)
+            by_id[entry[0]] = entry
+            if row_code:
+                by_code.setdefault(row_code, entry)
+            if row_name:
+                by_name.setdefault(row_name, entry)
+        return (by_id, by_code, by_name)
+
     @staticmethod
     def list_po_runtime_texts(db: Session, po_id: int) -> list[POText]:
         return (
@@ -308,25 +422,32 @@ class TextProfileService:
         )
 
     @staticmethod
-    def upsert_po_runtime_texts(
+    def _upsert_runtime_text_records(
         db: Session,
         *,
-        po_id: int,
+        model: type[POText] | type[ShipmentText],
+        parent_field: str,
+        parent_id: int,
         rows: list[dict[str, Any]],
         user_email: str | None,
         profile_id: int | None,
         profile_version: int | None,
         mark_user_edited: bool,
-    ) -> list[POText]:
-        existing = {
-            (int(row.text_type_id), _normalize_language(row.language)): row
-            for row in TextProfileService.list_po_runtime_texts(db, po_id)
-        }
-        actor = user_email or "system@local"
+    ) -> None:
+        """Upsert runtime-text payload rows with one bulk INSERT ... ON CONFLICT.
 
+        Replaces the per-row ORM load/mutate/flush cycle; the unique
+        constraint on (parent, text_type_id, language) drives the conflict
+        target. ``is_user_edited`` keeps its sticky OR semantics by combining
+        the current column with the excluded value.
+        """
+        actor = user_email or "system@local"
+        records: dict[tuple[int, str], dict[str, Any]] = {}
+        type_id_cache: dict[tuple[Any, str, str], int | None] = {}
         for payload in rows:
-            text_type_id = TextProfileService.resolve_text_type_id(
+            text_type_id = TextProfileService._resolve_text_type_id_cached(
                 db,
+                type_id_cache,
                 text_type_id=payload.get("text_type_id"),
                 text_type_code=payload.get("text_type_code"),
                 text_type_name=payload.get("text_type_name"),
@@ -337,32 +458,73 @@ class TextProfileService:
             text_value = (payload.get("text_value") or "").strip()
             if not text_value:
                 continue
+            # Last payload row wins per key, matching the previous loop, and
+            # keeps ON CONFLICT from touching the same row twice.
+            records[(text_type_id, language)] = {
+                parent_field: parent_id,
+                "profile_id": profile_id,
+                "profile_version": profile_version,
+                "text_type_id": text_type_id,
+                "language": language,
+                "text_value": text_value,
+                "is_user_edited": mark_user_edited,
+                "created_by": actor,
+                "last_changed_by": actor,
+            }
+        if not records:
+            return
 
-            key = (text_type_id, language)
-            current = existing.get(key)
-            if current is None:
-                current = POText(
-                    po_header_id=po_id,
-                    profile_id=profile_id,
-                    profile_version=profile_version,
-                    text_type_id=text_type_id,
-                    language=language,
-                    text_value=text_value,
-                    is_user_edited=mark_user_edited,
-                    created_by=actor,
-                    last_changed_by=actor,
-                )
-                db.add(current)
-                existing[key] = current
-            else:
-                current.profile_id = profile_id
-                current.profile_version = profile_version
-                current.text_value = text_value
-                current.is_user_edited = bool(current.is_user_edited or mark_user_edited)
-                current.last_changed_by = actor
+        table = model.__table__
+        insert_fn = (
+            sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+        )
+        statement = insert_fn(table).values(list(records.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=[parent_field, "text_type_id", "language"],
+            set_={
+                "profile_id": statement.excluded.profile_id,
+                "profile_version": statement.excluded.profile_version,
+                "text_value": statement.excluded.text_value,
+                "is_user_edited": or_(
+                    table.c.is_user_edited, statement.excluded.is_user_edited
+                ),
+                "last_changed_by": statement.excluded.last_changed_by,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(statement)
 
-        db.flush()
-        return TextProfileService.list_po_runtime_texts(db, po_id)
+    @staticmethod
+    def upsert_po_runtime_texts(
+        db: Session,
+        *,
+        po_id: int,
+        rows: list[dict[str, Any]],
+        user_email: str | None,
+        profile_id: int | None,
+        profile_version: int | None,
+        mark_user_edited: bool,
+    ) -> list[POText]:
+        TextProfileService._upsert_runtime_text_records(
+            db,
+            model=POText,
+            parent_field="po_header_id",
+            parent_id=po_id,
+            rows=rows,
+            user_email=user_email,
+            profile_id=profile_id,
+            profile_version=profile_version,
+            mark_user_edited=mark_user_edited,
+        )
+        # populate_existing refreshes any rows already held in the identity
+        # map, since the bulk statement bypasses ORM change tracking.
+        return (
+            db.query(POText)
+            .filter(POText.po_header_id == po_id)
+            .order_by(POText.id.asc())
+            .populate_existing()
+            .all()
+        )
 
     @staticmethod
     def upsert_shipment_runtime_texts(
@@ -375,51 +537,26 @@ class TextProfileService:
         profile_version: int | None,
         mark_user_edited: bool,
     ) -> list[ShipmentText]:
-        existing = {
-            (int(row.text_type_id), _normalize_language(row.language)): row
-            for row in TextProfileService.list_shipment_runtime_texts(db, shipment_id)
-        }
-        actor = user_email or "system@local"
-
-        for payload in rows:
-            text_type_id = TextProfileService.resolve_text_type_id(
-                db,
-                text_type_id=payload.get("text_type_id"),
-                text_type_code=payload.get("text_type_code"),
-                text_type_name=payload.get("text_type_name"),
-            )
-            if text_type_id is None:
-                continue
-            language = _normalize_language(payload.get("language"))
-            text_value = (payload.get("text_value") or "").strip()
-            if not text_value:
-                continue
-
-            key = (text_type_id, language)
-            current = existing.get(key)
-            if current is None:
-                current = ShipmentText(
-                    shipment_header_id=shipment_id,
-                    profile_id=profile_id,
-                    profile_version=profile_version,
-                    text_type_id=text_type_id,
-                    language=language,
-                    text_value=text_value,
-                    is_user_edited=mark_user_edited,
-                    created_by=actor,
-                    last_changed_by=actor,
-                )
-                db.add(current)
-                existing[key] = current
-            else:
-                current.profile_id = profile_id
-                current.profile_version = profile_version
-                current.text_value = text_value
-                current.is_user_edited = bool(current.is_user_edited or mark_user_edited)
-                current.last_changed_by = actor
-
-        db.flush()
-        return TextProfileService.list_shipment_runtime_texts(db, shipment_id)
+        TextProfileService._upsert_runtime_text_records(
+            db,
+            model=ShipmentText,
+            parent_field="shipment_header_id",
+            parent_id=shipment_id,
+            rows=rows,
+            user_email=user_email,
+            profile_id=profile_id,
+            profile_version=profile_version,
+            mark_user_edited=mark_user_edited,
+        )
+        # populate_existing refreshes any rows already held in the identity
+        # map, since the bulk statement bypasses ORM change tracking.
+        return (
+            db.query(ShipmentText)
+            .filter(ShipmentText.shipment_header_id == shipment_id)
+            .order_by(ShipmentText.id.asc())
+            .populate_existing()
+            .all()
+        )
 
     @staticmethod
     def _resolve_text_profile(
@@ -439,9 +576,9 @@ class TextProfileService:
             country_override=country_override,
         )
 
-        preferred_profile_id: int | None = None
-        preferred_profile_name: str | None = None
-        preferred_profile_version: int | None = None
+        decision: ResolvedTextProfile | None = None
+        speculative: ResolvedTextProfile | None = None
+        today = _today()
 
         if settings.TEXT_PROFILE_RESOLVE_MODE == "decision_then_db":
             decision_context = TextProfileService._build_decision_context(
@@ -451,39 +588,71 @@ class TextProfileService:
                 language=language,
                 country_code=country_code,
             )
-            decision = TextProfileService._resolve_from_decision_engine(
+            # Start the HTTP evaluation, then resolve the no-preference DB
+            # fallback on this thread while it is in flight. The speculative
+            # result is what we would need anyway when the decision engine is
+            # down or has no match, so the serial wait collapses to
+            # max(decision_ms, db_ms) in that common case.
+            decision_future = _DECISION_EXECUTOR.submit(
+                TextProfileService._evaluate_decision_payload,
+                table_slug,
+                decision_context,
+            )
+            speculative = TextProfileService._resolve_from_db_rules(
                 db,
-                table_slug=table_slug,
-                context=decision_context,
+                object_type=object_type,
+                language=language,
+                country_code=country_code,
+                preferred_profile_id=None,
+                preferred_profile_name=None,
+                preferred_profile_version=None,
+                today=today,
             )
-            if decision is not None:
-                preferred_profile_id = decision.profile_id
-                preferred_profile_name = decision.profile_name
-                preferred_profile_version = decision.profile_version
-                if decision.texts:
-                    TextProfileService._audit(
-                        object_type=object_type,
-                        source="decision_engine",
-                        profile_id=decision.profile_id,
-                        text_count=len(decision.texts),
-                        language=language,
-                        country_code=country_code,
-                    )
-                    return decision
+            payload = decision_future.result()
+            if payload is not None:
+                decision = TextProfileService._decision_payload_to_profile(
+                    db,
+                    payload=payload,
+                    context=decision_context,
+                )
+            if decision is not None and decision.texts:
+                TextProfileService._audit(
+                    object_type=object_type,
+                    source="decision_engine",
+                    profile_id=decision.profile_id,
+                    text_count=len(decision.texts),
+                    language=language,
+                    country_code=country_code,
+                )
+                return decision
 
-        resolved = TextProfileService._resolve_from_db_rules(
-            db,
-            object_type=object_type,
-            language=language,
-            country_code=country_code,
-            preferred_profile_id=preferred_profile_id,
-            preferred_profile_name=preferred_profile_name,
-            preferred_profile_version=preferred_profile_version,
-            preferred_from_decision=(
-                settings.TEXT_PROFILE_RESOLVE_MODE == "decision_then_db"
-                and (preferred_profile_id is not None or bool(preferred_profile_name))
-            ),
-        )
+        if decision is None:
+            resolved = speculative
+            if resolved is None:
+                resolved = TextProfileService._resolve_from_db_rules(
+                    db,
+                    object_type=object_type,
+                    language=language,
+                    country_code=country_code,
+                    preferred_profile_id=None,
+                    preferred_profile_name=None,
+                    preferred_profile_version=None,
+                    today=today,
+                )
+        else:
+            resolved = TextProfileService._resolve_from_db_rules(
+                db,
+                object_type=object_type,
+                language=language,
+                country_code=country_code,
+                preferred_profile_id=decision.profile_id,
+                preferred_profile_name=decision.profile_name,
+                preferred_profile_version=decision.profile_version,
+                preferred_from_decision=(
+                    decision.profile_id is not None or bool(decision.profile_name)
+                ),
+                today=today,
+            )
         TextProfileService._audit(
             object_type=object_type,
             source=resolved.source,
@@ -495,14 +664,12 @@ class TextProfileService:
         return resolved
 
     @staticmethod
-    def _resolve_from_decision_engine(
-        db: Session,
-        *,
-        table_slug: str,
-        context: dict[str, Any],
-    ) -> ResolvedTextProfile | None:
+    def _evaluate_decision_payload(
+        table_slug: str, context: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """HTTP-only half of decision resolution; safe to run off-thread."""
         try:
-            payload = evaluate_decision(
+            return evaluate_decision(
                 {"table_slug": table_slug, "context": context},
                 timeout_seconds=8,
             )
@@ -510,6 +677,13 @@ class TextProfileService:
             logger.info("text_profile_decision_engine_fallback slug=%s error=%s", table_slug, exc)
             return None
 
+    @staticmethod
+    def _decision_payload_to_profile(
+        db: Session,
+        *,
+        payload: dict[str, Any],
+        context: dict[str, Any],
+    ) -> ResolvedTextProfile | None:
         result = payload.get("result") if isinstance(payload, dict) else None
         if isinstance(result, str):
             profile_name = TextProfileService._as_text(result)
@@ -540,23 +714,47 @@ class TextProfileService:
         rows = result.get("texts")
         text_rows: list[ResolvedTextRow] = []
         if isinstance(rows, list):
+            # First pass: collect candidate keys so all text types load in one
+            # SELECT instead of two round-trips per row.
+            keyed_rows: list[tuple[dict[str, Any], int | None, str | None, str | None]] = []
+            candidate_ids: set[int] = set()
+            candidate_codes: set[str] = set()
+            candidate_names: set[str] = set()
             for row in rows:
                 if not isinstance(row, dict):
                     continue
-                text_type_id = TextProfileService.resolve_text_type_id(
-                    db,
-                    text_type_id=TextProfileService._as_int(row.get("text_type_id")),
-                    text_type_code=TextProfileService._as_text(row.get("text_type_code")),
-                    text_type_name=TextProfileService._as_text(row.get("text_type_name")),
-                )
-                if text_type_id is None:
+                row_id = TextProfileService._as_int(row.get("text_type_id"))
+                row_code = TextProfileService._as_text(row.get("text_type_code"))
+                row_name = TextProfileService._as_text(row.get("text_type_name"))
+                keyed_rows.append((row, row_id, row_code, row_name))
+                if row_id is not None:
+                    candidate_ids.add(row_id)
+                else:
+                    if row_code:
+                        candidate_codes.add(row_code)
+                    if row_name:
+                        candidate_names.add(row_name)
+
+            by_id, by_code, by_name = TextProfileService._load_text_type_index(
+                db,
+                ids=candidate_ids,
+                codes=candidate_codes,
+                names=candidate_names,
+            )
+            for row, row_id, row_code, row_name in keyed_rows:
+                if row_id is not None:
+                    lookup = by_id.get(row_id)
+                else:
+                    lookup = by_code.get(row_code) if row_code else None
+                    if lookup is None and row_name:
+                        lookup = by_name.get(row_name)
+                if lookup is None:
                     continue
-                lookup = db.query(TextTypeLookup).filter(TextTypeLookup.id == text_type_id).first()
                 text_rows.append(
                     ResolvedTextRow(
-                        text_type_id=text_type_id,
-                        text_type_code=lookup.text_type_code if lookup else None,
-                        text_type_name=lookup.text_type_name if lookup else None,
+                        text_type_id=lookup[0],
+                        text_type_code=lookup[1],
+                        text_type_name=lookup[2],
                         language=_normalize_language(row.get("language") or language),
                         text_value=TextProfileService._as_text(row.get("text_value")) or "",
                         is_editable=bool(row.get("is_editable", True)),
@@ -606,9 +804,21 @@ class TextProfileService:
     @staticmethod
     def _decision_attribute_keys_for_object_type(object_type: str) -> set[str]:
         engine_object_type = "PURCHASE_ORDER" if object_type == "PO" else object_type
+
+        if not settings.TEXT_PROFILE_FORCE_REMOTE_METADATA:
+            local_keys = set(get_attribute_registry(engine_object_type).keys())
+            if local_keys:
+                return local_keys
+
+        now = monotonic()
+        with _ATTR_KEYS_LOCK:
+            cached = _ATTR_KEYS_CACHE.get(engine_object_type)
+            if cached is not None and now < cached[0]:
+                return set(cached[1])
+
         url = f"{settings.DECISION_ENGINE_URL.rstrip('/')}/proxy/metadata/attributes/{engine_object_type}"
         try:
-            response = requests.get(url, timeout=8)
+            response = _DE_SESSION.get(url, timeout=8)
             response.raise_for_status()
             body = response.json()
             if isinstance(body, dict):
@@ -620,6 +830,11 @@ class TextProfileService:
                         if isinstance(item, dict) and item.get("key")
                     }
                     if keys:
+                        with _ATTR_KEYS_LOCK:
+                            _ATTR_KEYS_CACHE[engine_object_type] = (
+                                now + _ATTR_KEYS_TTL_SECONDS,
+                                set(keys),
+                            )
                         return keys
         except Exception as exc:
             logger.info(
@@ -629,41 +844,89 @@ class TextProfileService:
             )
         return set(get_attribute_registry(engine_object_type).keys())
 
+    @staticmethod
+    def _fetch_enrichment_rows(
+        db: Session, selects: list[Any]
+    ) -> dict[str, tuple[Any, ...]]:
+        """Run the per-id lookup branches as one UNION ALL round-trip.
+
+        Each branch is a single-row SELECT tagged with a ``kind`` literal so
+        the results can be dispatched back to their payload keys.
+        """
+        if not selects:
+            return {}
+        statement = selects[0] if len(selects) == 1 else union_all(*selects)
+        return {row[0]: tuple(row[1:]) for row in db.execute(statement).all()}
+
     @staticmethod
     def _enrich_po_decision_context(db: Session, payload: dict[str, Any]) -> None:
+        selects: list[Any] = []
+
         type_id = TextProfileService._as_int(payload.get("type_id"))
         if payload.get("po_type") is None and type_id is not None:
-            row = (
-                db.query(PurchaseOrderTypeLookup.type_code, PurchaseOrderTypeLookup.type_name)
-                .filter(PurchaseOrderTypeLookup.id == type_id)
-                .first()
+            selects.append(
+                select(
+                    literal("po_type").label("kind"),
+                    PurchaseOrderTypeLookup.type_code,
+                    PurchaseOrderTypeLookup.type_name,
+                    literal(None),
+                ).where(PurchaseOrderTypeLookup.id == type_id)
             )
-            if row is not None:
-                payload["po_type"] = row[0] or row[1]
 
         purchase_org_id = TextProfileService._as_int(payload.get("purchase_org_id"))
         if payload.get("purchase_org") is None and purchase_org_id is not None:
-            row = (
-                db.query(PurchaseOrgLookup.org_code, PurchaseOrgLookup.org_name)
-                .filter(PurchaseOrgLookup.id == purchase_org_id)
-                .first()
+            selects.append(
+                select(
+                    literal("purchase_org").label("kind"),
+                    PurchaseOrgLookup.org_code,
+                    PurchaseOrgLookup.org_name,
+                    literal(None),
+                ).where(PurchaseOrgLookup.id == purchase_org_id)
             )
-            if row is not None:
-                payload["purchase_org"] = row[0] or row[1]
 
         vendor_id = TextProfileService._as_int(payload.get("vendor_id"))
-        vendor = TextProfileService._partner_lookup(db, vendor_id)
-        if payload.get("vendor_code") is None:
-            payload["vendor_code"] = vendor[0]
-        if payload.get("vendor_name") is None:
-            payload["vendor_name"] = vendor[1]
+        if vendor_id is not None and (
+            payload.get("vendor_code") is None or payload.get("vendor_name") is None
+        ):
+            selects.append(
+                select(
+                    literal("vendor").label("kind"),
+                    PartnerMaster.partner_identifier,
+                    PartnerMaster.trade_name,
+                    PartnerMaster.legal_name,
+                ).where(PartnerMaster.id == vendor_id)
+            )
 
         forwarder_id = TextProfileService._as_int(payload.get("forwarder_id"))
-        forwarder = TextProfileService._partner_lookup(db, forwarder_id)
-        if payload.get("forwarder_code") is None:
-            payload["forwarder_code"] = forwarder[0]
-        if payload.get("forwarder_name") is None:
-            payload["forwarder_name"] = forwarder[1]
+        if forwarder_id is not None and (
+            payload.get("forwarder_code") is None or payload.get("forwarder_name") is None
+        ):
+            selects.append(
+                select(
+                    literal("forwarder").label("kind"),
+                    PartnerMaster.partner_identifier,
+                    PartnerMaster.trade_name,
+                    PartnerMaster.legal_name,
+                ).where(PartnerMaster.id == forwarder_id)
+            )
+
+        rows = TextProfileService._fetch_enrichment_rows(db, selects)
+
+        row = rows.get("po_type")
+        if row is not None and payload.get("po_type") is None:
+            payload["po_type"] = row[0] or row[1]
+        row = rows.get("purchase_org")
+        if row is not None and payload.get("purchase_org") is None:
+            payload["purchase_org"] = row[0] or row[1]
+        for kind, code_key, name_key in (
+            ("vendor", "vendor_code", "vendor_name"),
+            ("forwarder", "forwarder_code", "forwarder_name"),
+        ):
+            row = rows.get(kind)
+            if payload.get(code_key) is None:
+                payload[code_key] = row[0] if row else None
+            if payload.get(name_key) is None:
+                payload[name_key] = (row[1] or row[2]) if row else None
 
         for key in (
             "po_type",
@@ -677,49 +940,85 @@ class TextProfileService:
 
     @staticmethod
     def _enrich_shipment_decision_context(db: Session, payload: dict[str, Any]) -> None:
+        selects: list[Any] = []
+
         type_id = TextProfileService._as_int(payload.get("type_id"))
         if payload.get("shipment_type") is None and type_id is not None:
-            row = (
-                db.query(ShipTypeLookup.type_code, ShipTypeLookup.type_name)
-                .filter(ShipTypeLookup.id == type_id)
-                .first()
+            selects.append(
+                select(
+                    literal("shipment_type").label("kind"),
+                    ShipTypeLookup.type_code,
+                    ShipTypeLookup.type_name,
+                    literal(None),
+                ).where(ShipTypeLookup.id == type_id)
             )
-            if row is not None:
-                payload["shipment_type"] = row[0] or row[1]
 
         mode_id = TextProfileService._as_int(payload.get("mode_id"))
         if payload.get("transport_mode") is None and mode_id is not None:
-            row = (
-                db.query(TransportModeLookup.mode_code, TransportModeLookup.mode_name)
-                .filter(TransportModeLookup.id == mode_id)
-                .first()
+            selects.append(
+                select(
+                    literal("transport_mode").label("kind"),
+                    TransportModeLookup.mode_code,
+                    TransportModeLookup.mode_name,
+                    literal(None),
+                ).where(TransportModeLookup.id == mode_id)
             )
-            if row is not None:
-                payload["transport_mode"] = row[0] or row[1]
 
         carrier_id = TextProfileService._as_int(payload.get("carrier_id"))
-        carrier = TextProfileService._partner_lookup(db, carrier_id)
-        if payload.get("carrier_code") is None:
-            payload["carrier_code"] = carrier[0]
-        if payload.get("carrier_name") is None:
-            payload["carrier_name"] = carrier[1]
+        if carrier_id is not None and (
+            payload.get("carrier_code") is None or payload.get("carrier_name") is None
+        ):
+            selects.append(
+                select(
+                    literal("carrier").label("kind"),
+                    PartnerMaster.partner_identifier,
+                    PartnerMaster.trade_name,
+                    PartnerMaster.legal_name,
+                ).where(PartnerMaster.id == carrier_id)
+            )
 
         pol_port_id = TextProfileService._as_int(payload.get("pol_port_id"))
-        if payload.get("pol_port_code") is None and pol_port_id is not None:
-            row = (
-                db.query(PortLookup.port_code)
-                .filter(PortLookup.id == pol_port_id)
-                .first()
+        set_pol = payload.get("pol_port_code") is None and pol_port_id is not None
+        if set_pol:
+            selects.append(
+                select(
+                    literal("pol_port").label("kind"),
+                    PortLookup.port_code,
+                    literal(None),
+                    literal(None),
+                ).where(PortLookup.id == pol_port_id)
             )
-            payload["pol_port_code"] = row[0] if row else None
 
         pod_port_id = TextProfileService._as_int(payload.get("pod_port_id"))
-        if payload.get("pod_port_code") is None and pod_port_id is not None:
-            row = (
-                db.query(PortLookup.port_code)
-                .filter(PortLookup.id == pod_port_id)
-                .first()
+        set_pod = payload.get("pod_port_code") is None and pod_port_id is not None
+        if set_pod:
+            selects.append(
+                select(
+                    literal("pod_port").label("kind"),
+                    PortLookup.port_code,
+                    literal(None),
+                    literal(None),
+                ).where(PortLookup.id == pod_port_id)
             )
+
+        rows = TextProfileService._fetch_enrichment_rows(db, selects)
+
+        row = rows.get("shipment_type")
+        if row is not None and payload.get("shipment_type") is None:
+            payload["shipment_type"] = row[0] or row[1]
+        row = rows.get("transport_mode")
+        if row is not None and payload.get("transport_mode") is None:
+            payload["transport_mode"] = row[0] or row[1]
+        row = rows.get("carrier")
+        if payload.get("carrier_code") is None:
+            payload["carrier_code"] = row[0] if row else None
+        if payload.get("carrier_name") is None:
+            payload["carrier_name"] = (row[1] or row[2]) if row else None
+        if set_pol:
+            row = rows.get("pol_port")
+            payload["pol_port_code"] = row[0] if row else None
+        if set_pod:
+            row = rows.get("pod_port")
             payload["pod_port_code"] = row[0] if row else None
 
         for key in (
@@ -731,25 +1030,6 @@ class TextProfileService:
         ):
             payload.setdefault(key, None)
 
-    @staticmethod
-    def _partner_lookup(db: Session, partner_id: int | None) -> tuple[str | None, str | None]:
-        if partner_id is None:
-            return (None, None)
-        row = (
-            db.query(
-                PartnerMaster.partner_identifier,
-                PartnerMaster.trade_name,
-                PartnerMaster.legal_name,
-            )
-            .filter(PartnerMaster.id == partner_id)
-            .first()
-        )
-        if row is None:
-            return (None, None)
-        partner_code = row[0]
-        partner_name = row[1] or row[2]
-        return (partner_code, partner_name)
-
     @staticmethod
     def _resolve_from_db_rules(
         db: Session,
@@ -761,7 +1041,12 @@ class TextProfileService:
         preferred_profile_name: str | None,
         preferred_profile_version: int | None,
         preferred_from_decision: bool = False,
+        today: date | None = None,
     ) -> ResolvedTextProfile:
+        # One date per resolution keeps effectiveness checks consistent
+        # across the profile, rule, and value queries (no midnight race).
+        if today is None:
+            today = _today()
         profile, matched_preferred = TextProfileService._pick_profile(
             db,
             object_type=object_type,
@@ -769,6 +1054,7 @@ class TextProfileService:
             country_code=country_code,
             preferred_profile_id=preferred_profile_id,
             preferred_profile_name=preferred_profile_name,
+            today=today,
         )
         if profile is None:
             return ResolvedTextProfile(
@@ -782,40 +1068,48 @@ class TextProfileService:
             )
 
         maps = (
-            db.query(ProfileTextMap, TextTypeLookup)
+            db.query(
+                ProfileTextMap.id,
+                ProfileTextMap.is_editable,
+                ProfileTextMap.is_mandatory,
+                TextTypeLookup.id.label("text_type_id"),
+                TextTypeLookup.text_type_code,
+                TextTypeLookup.text_type_name,
+            )
             .join(TextTypeLookup, TextTypeLookup.id == ProfileTextMap.text_type_id)
             .filter(ProfileTextMap.profile_id == profile.id)
             .filter(ProfileTextMap.is_active == True)
             .order_by(ProfileTextMap.sequence.asc(), ProfileTextMap.id.asc())
             .all()
         )
-        map_ids = [row.id for row, _ in maps]
-        values_by_map_id: dict[int, list[ProfileTextValue]] = {}
+        map_ids = [row.id for row in maps]
+        values_by_map_id: dict[int, list[ProfileTextValue]] = defaultdict(list)
         if map_ids:
-            today = _today()
             values = (
                 db.query(ProfileTextValue)
                 .filter(ProfileTextValue.profile_text_map_id.in_(map_ids))
                 .filter(ProfileTextValue.is_active == True)
-                .all()
+                .filter(
+                    or_(ProfileTextValue.valid_from.is_(None), ProfileTextValue.valid_from <= today),
+                    or_(ProfileTextValue.valid_to.is_(None), ProfileTextValue.valid_to >= today),
+                )
+                .yield_per(500)
             )
             for value in values:
-                if not _is_effective_on(value.valid_from, value.valid_to, today):
-                    continue
-                values_by_map_id.setdefault(int(value.profile_text_map_id), []).append(value)
+                values_by_map_id[value.profile_text_map_id].append(value)
 
         resolved_rows: list[ResolvedTextRow] = []
-        for map_row, text_type in maps:
+        for map_row in maps:
             selected = TextProfileService._pick_profile_text_value(
-                values_by_map_id.get(int(map_row.id), []),
+                values_by_map_id.get(map_row.id, []),
                 language=language,
                 country_code=country_code,
             )
             resolved_rows.append(
                 ResolvedTextRow(
-                    text_type_id=int(text_type.id),
-                    text_type_code=text_type.text_type_code,
-                    text_type_name=text_type.text_type_name,
+                    text_type_id=int(map_row.text_type_id),
+                    text_type_code=map_row.text_type_code,
+                    text_type_name=map_row.text_type_name,
                     language=language,
                     text_value=selected.text_value if selected is not None else "",
                     is_editable=bool(map_row.is_editable),
@@ -847,8 +1141,10 @@ class TextProfileService:
         country_code: str | None,
         preferred_profile_id: int | None,
         preferred_profile_name: str | None,
+        today: date | None = None,
     ) -> tuple[TextProfile | None, bool]:
-        today = _today()
+        if today is None:
+            today = _today()
         object_type_aliases = TextProfileService._object_type_aliases(object_type)
         if not object_type_aliases:
             return (None, False)
@@ -864,52 +1160,67 @@ class TextProfileService:
         if preferred_profile_name:
             name = preferred_profile_name.strip()
             profile = base_query.filter(TextProfile.name == name).first()
+            if profile is None and name:
+                # Prefix match is index-friendly and covers the usual
+                # "short hint for a longer profile name" case; the contains
+                # scan stays as a last resort for mid-name hints.
+                profile = base_query.filter(TextProfile.name.ilike(f"{name}%")).first()
             if profile is None and name:
                 profile = base_query.filter(TextProfile.name.ilike(f"%{name}%")).first()
             if profile is not None and _is_effective_on(profile.effective_from, profile.effective_to, today):
                 return (profile, True)
 
-        rules = (
-            db.query(TextProfileRule, TextProfile)
-            .join(TextProfile, TextProfile.id == TextProfileRule.profile_id)
+        # Normalized SQL counterparts of _normalize_country / _normalize_language
+        # so filtering and ranking stay in the database and only the winning
+        # candidate is transferred.
+        rule_country = func.upper(func.trim(func.coalesce(TextProfileRule.country_code, "")))
+        rule_language_raw = func.replace(
+            func.lower(func.trim(func.coalesce(TextProfileRule.language, ""))), "_", "-"
+        )
+        rule_language = case((rule_language_raw == "", "en"), else_=rule_language_raw)
+
+        country_allowed = rule_country.in_(("", "*"))
+        country_score = literal(1)
+        if country_code is not None:
+            country_allowed = or_(country_allowed, rule_country == country_code)
+            country_score = case((rule_country == country_code, 0), else_=1)
+
+        language_allowed = rule_language.in_(("*", language, "en"))
+        language_score = case(
+            (rule_language == language, 0),
+            (rule_language == "en", 1),
+            else_=2,
+        )
+        priority = case(
+            (func.coalesce(TextProfileRule.priority, 0) == 0, 1000),
+            else_=TextProfileRule.priority,
+        )
+
+        winner = (
+            db.query(TextProfile)
+            .join(TextProfileRule, TextProfileRule.profile_id == TextProfile.id)
             .filter(TextProfileRule.object_type.in_(object_type_aliases))
             .filter(TextProfileRule.is_active == True)
             .filter(TextProfile.is_active == True)
-            .all()
+            .filter(
+                or_(TextProfileRule.effective_from.is_(None), TextProfileRule.effective_from <= today),
+                or_(TextProfileRule.effective_to.is_(None), TextProfileRule.effective_to >= today),
+                or_(TextProfile.effective_from.is_(None), TextProfile.effective_from <= today),
+                or_(TextProfile.effective_to.is_(None), TextProfile.effective_to >= today),
+            )
+            .filter(country_allowed)
+            .filter(language_allowed)
+            .order_by(priority, country_score, language_score, TextProfileRule.id.asc())
+            .limit(1)
+            .first()
         )
-        candidates: list[tuple[tuple[int, int, int, int], TextProfile]] = []
-        for rule, profile in rules:
-            if not _is_effective_on(rule.effective_from, rule.effective_to, today):
-                continue
-            if not _is_effective_on(profile.effective_from, profile.effective_to, today):
-                continue
-
-            rule_country = _normalize_country(rule.country_code)
-            if rule_country not in {None, "*"} and rule_country != country_code:
-                continue
-            country_score = 0 if rule_country == country_code and country_code is not None else 1
-
-            rule_language = _normalize_language(rule.language)
-            if rule_language not in {"*", language, "en"}:
-                continue
-            if rule_language == language:
-                language_score = 0
-            elif rule_language == "en":
-                language_score = 1
-            else:
-                language_score = 2
+        if winner is not None:
+            return (winner, False)
 
-            priority = int(rule.priority or 1000)
-            candidates.append(((priority, country_score, language_score, int(rule.id)), profile))
-
-        if not candidates:
-            profile = base_query.order_by(TextProfile.id.asc()).first()
-            if profile is not None and _is_effective_on(profile.effective_from, profile.effective_to, today):
-                return (profile, False)
-            return (None, False)
-
-        candidates.sort(key=lambda row: row[0])
-        return (candidates[0][1], False)
+        profile = base_query.order_by(TextProfile.id.asc()).first()
+        if profile is not None and _is_effective_on(profile.effective_from, profile.effective_to, today):
+            return (profile, False)
+        return (None, False)
 
     @staticmethod
     def _pick_profile_text_value(
@@ -921,33 +1232,38 @@ class TextProfileService:
         if not values:
             return None
 
-        def _country_bucket(raw_country: str | None) -> int:
-            norm = _normalize_country(raw_country)
-            if country_code and norm == country_code:
-                return 0
-            if norm in {None, "*"}:
-                return 1
-            return 2
-
-        def _language_bucket(raw_language: str | None) -> int:
-            norm = _normalize_language(raw_language)
-            if norm == language:
-                return 0
-            if norm == "en":
-                return 1
-            if norm == "*":
-                return 2
-            return 3
-
-        ranked = sorted(
-            values,
-            key=lambda row: (
-                _language_bucket(row.language),
-                _country_bucket(row.country_code),
-                int(row.id),
-            ),
-        )
-        return ranked[0] if ranked else None
+        # Only the minimum-ranked row is needed; a single-pass argmin avoids
+        # the O(n log n) sort and the decorated intermediate list. The bucket
+        # logic is inlined with the normalizers bound to locals so the loop
+        # body avoids per-row closure and global lookups.
+        norm_language = _normalize_language
+        norm_country = _normalize_country
+        best_key: tuple[int, int, int] | None = None
+        best: ProfileTextValue | None = None
+        for row in values:
+            lang_norm = norm_language(row.language)
+            if lang_norm == language:
+                lang_bucket = 0
+            elif lang_norm == "en":
+                lang_bucket = 1
+            elif lang_norm == "*":
+                lang_bucket = 2
+            else:
+                lang_bucket = 3
+
+            country_norm = norm_country(row.country_code)
+            if country_code and country_norm == country_code:
+                country_bucket = 0
+            elif country_norm in (None, "*"):
+                country_bucket = 1
+            else:
+                country_bucket = 2
+
+            key = (lang_bucket, country_bucket, int(row.id))
+            if best_key is None or key < best_key:
+                best_key = key
+                best = row
+        return best
 
     @staticmethod
     def _as_int(value: Any) -> int | None:
@@ -955,9 +1271,20 @@ class TextProfileService:
             return None
         if isinstance(value, int):
             return value
+        if isinstance(value, str):
+            # Pre-screen with isdigit so non-numeric strings return None
+            # without paying for a raised-and-caught ValueError.
+            text = value.strip()
+            digits = text[1:] if text[:1] in ("+", "-") else text
+            if not digits.isdigit():
+                return None
+            try:
+                return int(text)
+            except ValueError:
+                return None
         try:
             return int(str(value).strip())
-        except Exception:
+        except (TypeError, ValueError):
             return None
 
     @staticmethod
@@ -977,7 +1304,7 @@ class TextProfileService:
         language: str,
         country_code: str | None,
     ) -> None:
-        if not settings.TEXT_PROFILE_AUDIT_ENABLED:
+        if not _AUDIT_ENABLED or not logger.isEnabledFor(logging.INFO):
             return
         logger.info(
             "text_profile_resolve object_type=%s source=%s profile_id=%s text_count=%s language=%s country=%s",
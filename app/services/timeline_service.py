@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from functools import lru_cache
 from typing import Any
 
 import requests
+from sqlalchemy import or_
 from sqlalchemy.orm import Session, joinedload
 
 from app.core.config import settings
@@ -13,6 +16,16 @@ from app.models.event_profile import EventProfile, ProfileEventMap
 from app.services.decision_engine_client import evaluate as evaluate_decision
 
 
+@dataclass(slots=True)
+class _TimelineNode:
+    event_code: str
+    event_name: str | None
+    anchor_event_code: str | None
+    anchor_event_name: str | None
+    offset_minutes: int
+    is_active: bool
+
+
 class TimelineService:
     """
     Dry-run planner for dependency-based events.
@@ -30,6 +43,11 @@ class TimelineService:
         self.db = db
         self.decision_engine_url = (decision_engine_url or settings.DECISION_ENGINE_URL).rstrip("/")
         self.timeout_seconds = timeout_seconds
+        # The service is constructed per request; dry-run and resolve calls
+        # within one request reuse the same profile rows and decision-engine
+        # responses without re-querying.
+        self._profile_events_cache: dict[int, list[ProfileEventMap]] = {}
+        self._rule_resp_cache: dict[tuple[str, str], dict[str, Any]] = {}
 
     def calculate_dry_run(
         self,
@@ -63,111 +81,125 @@ class TimelineService:
         if not rows:
             return profile_id, []
 
-        @lru_cache(maxsize=512)
-        def evaluate_inclusion_rule_cached(rule_slug: str) -> bool:
+        def evaluate_inclusion_rule(rule_slug: str) -> bool:
             response_payload = self._evaluate_rule(rule_slug, context_data)
             return self._extract_boolean_result(response_payload, rule_slug)
 
-        nodes: dict[str, dict[str, Any]] = {}
-        ordered_event_codes: list[str] = []
+        # Each rule evaluation is an HTTP round trip to the decision engine
+        # and the calls are independent, so evaluate the distinct slugs
+        # concurrently up front instead of serially inside the node loop.
+        distinct_rules = list(
+            dict.fromkeys(row.inclusion_rule_id for row in rows if row.inclusion_rule_id)
+        )
+        rule_cache: dict[str, bool] = {}
+        if len(distinct_rules) == 1:
+            rule_cache[distinct_rules[0]] = evaluate_inclusion_rule(distinct_rules[0])
+        elif distinct_rules:
+            with ThreadPoolExecutor(max_workers=min(8, len(distinct_rules))) as pool:
+                rule_cache.update(
+                    zip(distinct_rules, pool.map(evaluate_inclusion_rule, distinct_rules))
+                )
+
+        nodes: dict[str, _TimelineNode] = {}
+        ordered_nodes: list[_TimelineNode] = []
         for row in rows:
             is_active = True
             if row.inclusion_rule_id:
-                is_active = evaluate_inclusion_rule_cached(row.inclusion_rule_id)
-
-            nodes[row.event_code] = {
-                "event_code": row.event_code,
-                "event_name": row.event.event_name if row.event else None,
-                "anchor_event_code": row.anchor_event_code,
-                "anchor_event_name": row.anchor_event.event_name if row.anchor_event else None,
-                "offset_minutes": int(row.offset_days or 0),
-                "is_active": is_active,
-            }
-            ordered_event_codes.append(row.event_code)
+                is_active = rule_cache[row.inclusion_rule_id]
+
+            node = _TimelineNode(
+                event_code=row.event_code,
+                event_name=row.event.event_name if row.event else None,
+                anchor_event_code=row.anchor_event_code,
+                anchor_event_name=row.anchor_event.event_name if row.anchor_event else None,
+                offset_minutes=int(row.offset_days or 0),
+                is_active=is_active,
+            )
+            nodes[row.event_code] = node
+            ordered_nodes.append(node)
 
         planned_cache: dict[str, datetime] = {}
         anchor_used_cache: dict[str, str | None] = {}
 
-        def resolve_planned_date(event_code: str, trail: frozenset[str]) -> datetime:
-            if event_code in planned_cache:
-                return planned_cache[event_code]
-
-            node = nodes.get(event_code)
-            if node is None:
-                return start_dt
-
-            if event_code in normalized_fixed_dates:
-                fixed = normalized_fixed_dates[event_code]
-                _, anchor_used = resolve_active_anchor_date(
-                    node["anchor_event_code"],
-                    trail=trail | {event_code},
-                )
-                anchor_used_cache[event_code] = anchor_used
-                planned_cache[event_code] = fixed
-                return fixed
-
-            anchor_date, anchor_used = resolve_active_anchor_date(
-                node["anchor_event_code"],
-                trail=trail | {event_code},
-            )
-            planned = anchor_date + timedelta(minutes=node["offset_minutes"])
-            planned_cache[event_code] = planned
-            anchor_used_cache[event_code] = anchor_used
-            return planned
-
-        def resolve_active_anchor_date(
-            anchor_event_code: str | None,
-            trail: frozenset[str],
-        ) -> tuple[datetime, str | None]:
-            current = anchor_event_code
-            local_trail = set(trail)
-
-            while current:
-                if current in local_trail:
+        active_codes = [node.event_code for node in ordered_nodes if node.is_active]
+
+        # Effective anchor per active node: climb over skipped (inactive)
+        # anchors to the first active ancestor; None means the start boundary
+        # (no anchor, or an anchor outside the profile map). climbed_to
+        # memoizes the result for every skipped node on the walked path, so
+        # shared inactive chains are traversed once instead of per dependent.
+        effective: dict[str, str | None] = {}
+        climbed_to: dict[str, str | None] = {}
+        for code in active_codes:
+            current = nodes[code].anchor_event_code
+            path: list[str] = []
+            seen: set[str] = set()
+            while current and current in nodes and not nodes[current].is_active:
+                if current in climbed_to:
+                    current = climbed_to[current]
+                    break
+                if current in seen:
                     raise ValueError(f"Cyclic dependency detected while resolving '{current}'.")
-                local_trail.add(current)
-
-                anchor_node = nodes.get(current)
-                if anchor_node is None:
-                    # Anchor not in profile map: fall back to start boundary.
-                    return start_dt, None
-
-                if anchor_node["is_active"]:
-                    return (
-                        resolve_planned_date(current, trail=frozenset(local_trail)),
-                        current,
-                    )
-
-                # Anchor is skipped: climb to the anchor's anchor.
-                current = anchor_node["anchor_event_code"]
-
-            return start_dt, None
+                seen.add(current)
+                path.append(current)
+                current = nodes[current].anchor_event_code
+            resolved = current if current and current in nodes else None
+            for skipped in path:
+                climbed_to[skipped] = resolved
+            effective[code] = resolved
+
+        # Kahn's algorithm: one iterative pass instead of a recursive resolve
+        # per node. Each node has at most one in-profile dependency (its
+        # effective anchor), so indegrees are 0 or 1 and cycle detection
+        # falls out of the unresolved remainder.
+        dependents: dict[str, list[str]] = defaultdict(list)
+        ready: deque[str] = deque()
+        for code in active_codes:
+            anchor = effective[code]
+            if anchor is None:
+                ready.append(code)
+            else:
+                dependents[anchor].append(code)
+
+        resolved_count = 0
+        while ready:
+            code = ready.popleft()
+            resolved_count += 1
+            anchor = effective[code]
+            if code in normalized_fixed_dates:
+                planned = normalized_fixed_dates[code]
+            else:
+                anchor_date = planned_cache[anchor] if anchor is not None else start_dt
+                planned = anchor_date + timedelta(minutes=nodes[code].offset_minutes)
+            planned_cache[code] = planned
+            anchor_used_cache[code] = anchor
+            ready.extend(dependents.get(code, ()))
+
+        if resolved_count != len(active_codes):
+            unresolved = next(
+                code for code in active_codes if code not in planned_cache
+            )
+            raise ValueError(f"Cyclic dependency detected while resolving '{unresolved}'.")
 
         output: list[dict[str, Any]] = []
-        for event_code in ordered_event_codes:
-            node = nodes[event_code]
-            planned_date: datetime | None = None
-            if node["is_active"]:
-                planned_date = resolve_planned_date(event_code, trail=frozenset())
-
+        for node in ordered_nodes:
+            event_code = node.event_code
+            planned_date = planned_cache.get(event_code) if node.is_active else None
             anchor_used_code = anchor_used_cache.get(event_code)
-            anchor_used_name = (
-                nodes.get(anchor_used_code, {}).get("event_name")
-                if anchor_used_code
-                else None
-            )
+            anchor_used_node = nodes.get(anchor_used_code) if anchor_used_code else None
+            anchor_used_name = anchor_used_node.event_name if anchor_used_node else None
 
             output.append(
                 {
                     "event_code": event_code,
-                    "event_name": node.get("event_name"),
-                    "anchor_event_code": node.get("anchor_event_code"),
-                    "anchor_event_name": node.get("anchor_event_name"),
+                    "event_name": node.event_name,
+                    "anchor_event_code": node.anchor_event_code,
+                    "anchor_event_name": node.anchor_event_name,
                     "anchor_used_event_code": anchor_used_code,
                     "anchor_used_event_name": anchor_used_name,
-                    "offset_minutes": node.get("offset_minutes"),
+                    "offset_minutes": node.offset_minutes,
                     "planned_date": planned_date.isoformat() if planned_date else None,
-                    "is_active": bool(node["is_active"]),
+                    "is_active": node.is_active,
                 }
             )
 
@@ -177,14 +209,16 @@ class TimelineService:
         return self._resolve_profile_id(context_data)
 
     def _resolve_profile_id(self, context_data: dict[str, Any]) -> int:
-        context_data = self._enrich_context_for_profile_resolution(context_data)
+        # Normalized once here and shared with enrichment and slug fallback
+        # selection instead of re-stripping the same value in each helper.
+        object_type = str((context_data or {}).get("object_type") or "").strip().upper()
+        context_data = self._enrich_context_for_profile_resolution(context_data, object_type)
         direct_profile = context_data.get("profile_id")
         if isinstance(direct_profile, int):
             return direct_profile
         if isinstance(direct_profile, str) and direct_profile.strip().isdigit():
             return int(direct_profile.strip())
 
-        object_type = str(context_data.get("object_type") or "").strip().upper()
         if not settings.EVENTS_PROFILE_ENABLED:
             return self._resolve_default_profile_id(object_type)
 
@@ -232,29 +266,34 @@ class TimelineService:
                 "context_data.object_type must be PURCHASE_ORDER or SHIPMENT for default event profile resolution."
             )
 
-        row = (
-            self.db.query(EventProfile.id)
-            .filter(EventProfile.name == default_profile_name)
-            .first()
+        profile_id = self._lookup_profile_id_by_name(default_profile_name)
+        if profile_id is not None:
+            return profile_id
+
+        raise ValueError(
+            f"Default event profile '{default_profile_name}' was not found for object_type '{object_type}'."
         )
-        if row:
-            return int(row[0])
 
+    def _lookup_profile_id_by_name(self, profile_name: str) -> int | None:
+        # One round trip covering both the exact and the case-insensitive
+        # match, preferring the exact hit when both exist.
         row = (
             self.db.query(EventProfile.id)
-            .filter(EventProfile.name.ilike(default_profile_name))
+            .filter(
+                or_(
+                    EventProfile.name == profile_name,
+                    EventProfile.name.ilike(profile_name),
+                )
+            )
+            .order_by((EventProfile.name == profile_name).desc())
             .first()
         )
-        if row:
-            return int(row[0])
+        return int(row[0]) if row else None
 
-        raise ValueError(
-            f"Default event profile '{default_profile_name}' was not found for object_type '{object_type}'."
-        )
-
-    def _enrich_context_for_profile_resolution(self, context_data: dict[str, Any]) -> dict[str, Any]:
+    def _enrich_context_for_profile_resolution(
+        self, context_data: dict[str, Any], object_type: str
+    ) -> dict[str, Any]:
         enriched = dict(context_data or {})
-        object_type = str(enriched.get("object_type") or "").strip().upper()
 
         if object_type == "PURCHASE_ORDER":
             po_number = str(enriched.get("purchase_order_number") or "").strip()
@@ -284,7 +323,7 @@ class TimelineService:
         deduped: list[str] = []
         seen: set[str] = set()
         for slug in ordered:
-            normalized = str(slug or "").strip()
+            normalized = slug.strip() if isinstance(slug, str) else str(slug or "").strip()
             if not normalized:
                 continue
             key = normalized.lower()
@@ -295,7 +334,10 @@ class TimelineService:
         return deduped
 
     def _get_profile_events(self, profile_id: int) -> list[ProfileEventMap]:
-        return (
+        cached = self._profile_events_cache.get(profile_id)
+        if cached is not None:
+            return cached
+        rows = (
             self.db.query(ProfileEventMap)
             .options(
                 joinedload(ProfileEventMap.event),
@@ -305,6 +347,8 @@ class TimelineService:
             .order_by(ProfileEventMap.sequence.asc(), ProfileEventMap.id.asc())
             .all()
         )
+        self._profile_events_cache[profile_id] = rows
+        return rows
 
     @staticmethod
     def _normalize_datetime(value: datetime | date) -> datetime:
@@ -316,15 +360,23 @@ class TimelineService:
 
     def _evaluate_rule(self, table_slug: str, context_data: dict[str, Any]) -> dict[str, Any]:
         context_payload = dict(context_data or {})
+        # Back-to-back dry-run and resolve calls evaluate the same rule with
+        # the same context; the per-request cache spares the repeat HTTP call.
+        cache_key = (table_slug, json.dumps(context_payload, sort_keys=True, default=str))
+        cached = self._rule_resp_cache.get(cache_key)
+        if cached is not None:
+            return cached
         payload: dict[str, Any] = {
             "table_slug": table_slug,
             "context": context_payload,
         }
-        return evaluate_decision(
+        response = evaluate_decision(
             payload,
             timeout_seconds=self.timeout_seconds,
             decision_engine_url=self.decision_engine_url,
         )
+        self._rule_resp_cache[cache_key] = response
+        return response
 
     @staticmethod
     def _extract_profile_id(response_payload: dict[str, Any]) -> int | None:
@@ -355,23 +407,7 @@ class TimelineService:
         profile_name = self._extract_profile_name(response_payload)
         if not profile_name:
             return None
-
-        row = (
-            self.db.query(EventProfile.id)
-            .filter(EventProfile.name == profile_name)
-            .first()
-        )
-        if row:
-            return int(row[0])
-
-        row = (
-            self.db.query(EventProfile.id)
-            .filter(EventProfile.name.ilike(profile_name))
-            .first()
-        )
-        if row:
-            return int(row[0])
-        return None
+        return self._lookup_profile_id_by_name(profile_name)
 
     @staticmethod
     def _extract_profile_name(response_payload: dict[str, Any]) -> str | None:
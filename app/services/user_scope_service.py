@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import String, cast, func, literal, null, select, union_all
 from sqlalchemy.orm import Session
 
+from app.models.company_master import CompanyMaster
 from app.models.customer_master import CustomerMaster
 from app.models.partner_master import PartnerMaster
 from app.models.partner_role import PartnerRole
@@ -14,8 +15,13 @@ from app.models.user_partner_link import UserPartnerLink
 from app.models.user_roles import UserRole
 from app.models.users import User
 
-_FORWARDER_CODES = {"FO", "FORWARDER"}
-_SUPPLIER_CODES = {"SU", "SUPPLIER"}
+# Partner role code -> scope bucket; a single dict lookup classifies a row.
+_ROLE_BUCKET: dict[str, str] = {
+    "FO": "forwarder",
+    "FORWARDER": "forwarder",
+    "SU": "supplier",
+    "SUPPLIER": "supplier",
+}
 
 
 @dataclass
@@ -55,91 +61,137 @@ def list_user_roles(db: Session, user_id: int) -> list[Role]:
 
 
 def list_user_customers(db: Session, user_email: str) -> list[dict]:
+    # Outer-join the columns we render directly so the listing is one SQL
+    # statement without per-link lazy loads or ORM object construction.
     stmt_user_customers = (
-        select(UserCustomerLink)
+        select(
+            UserCustomerLink.customer_id,
+            # SQL equivalent of the UserCustomerLink.customer_name property.
+            func.coalesce(
+                CustomerMaster.trade_name,
+                CustomerMaster.legal_name,
+                CustomerMaster.customer_identifier,
+            ).label("customer_name"),
+            CustomerMaster.customer_identifier,
+            CustomerMaster.company_id,
+            CompanyMaster.legal_name,
+        )
+        .join(
+            CustomerMaster,
+            CustomerMaster.id == UserCustomerLink.customer_id,
+            isouter=True,
+        )
+        .join(CompanyMaster, CompanyMaster.id == CustomerMaster.company_id, isouter=True)
         .where(UserCustomerLink.user_email == user_email)
         .where(UserCustomerLink.deletion_indicator == False)
     )
-    user_customers = db.execute(stmt_user_customers).scalars().all()
     return [
         {
-            "id": uc.customer_id,
-            "name": uc.customer_name,
-            "code": uc.customer.customer_identifier if uc.customer else None,
-            "company_id": uc.customer.company_id if uc.customer else None,
-            "company_name": (
-                uc.customer.company.legal_name
-                if uc.customer and uc.customer.company
-                else None
-            ),
+            "id": customer_id,
+            "name": customer_name,
+            "code": customer_identifier,
+            "company_id": company_id,
+            "company_name": legal_name,
         }
-        for uc in user_customers
+        for customer_id, customer_name, customer_identifier, company_id, legal_name
+        in db.execute(stmt_user_customers)
     ]
 
 
 def list_user_partners(db: Session, user_email: str) -> list[dict]:
     stmt_user_partners = (
-        select(UserPartnerLink)
+        select(
+            UserPartnerLink.partner_id,
+            # SQL equivalent of the UserPartnerLink.partner_name property.
+            func.coalesce(
+                PartnerMaster.trade_name,
+                PartnerMaster.legal_name,
+                PartnerMaster.partner_identifier,
+            ).label("partner_name"),
+            PartnerMaster.partner_identifier,
+            PartnerMaster.role_id,
+            PartnerRole.role_code,
+            PartnerRole.role_name,
+        )
+        .join(
+            PartnerMaster,
+            PartnerMaster.id == UserPartnerLink.partner_id,
+            isouter=True,
+        )
+        .join(PartnerRole, PartnerRole.id == PartnerMaster.role_id, isouter=True)
         .where(UserPartnerLink.user_email == user_email)
         .where(UserPartnerLink.deletion_indicator == False)
     )
-    user_partners = db.execute(stmt_user_partners).scalars().all()
     return [
         {
-            "id": up.partner_id,
-            "name": up.partner_name,
-            "code": up.partner.partner_identifier if up.partner else None,
-            "role_id": up.partner.role_id if up.partner else None,
-            "role_code": up.partner.role.role_code if up.partner and up.partner.role else None,
-            "role_name": up.partner.role.role_name if up.partner and up.partner.role else None,
+            "id": partner_id,
+            "name": partner_name,
+            "code": partner_identifier,
+            "role_id": role_id,
+            "role_code": role_code,
+            "role_name": role_name,
         }
-        for up in user_partners
+        for partner_id, partner_name, partner_identifier, role_id, role_code, role_name
+        in db.execute(stmt_user_partners)
     ]
 
 
 def resolve_union_scope_ids(db: Session, user_email: str) -> UserUnionScope:
-    role_rows = (
-        db.query(Role.name)
+    # The three scope kinds are fetched in one UNION ALL round trip with a
+    # discriminator column instead of three separate queries; ids are cast
+    # to String so the branches share a column shape.
+    role_select = (
+        select(
+            literal("role").label("kind"),
+            Role.name.label("value"),
+            null().label("role_code"),
+        )
         .join(UserRole, UserRole.role_id == Role.id)
         .join(User, User.id == UserRole.user_id)
-        .filter(User.email == user_email)
-        .all()
+        .where(User.email == user_email)
     )
-    role_names = {
-        (row[0] or "").strip().upper() for row in role_rows if row and row[0]
-    }
-
-    partner_rows = (
-        db.query(UserPartnerLink.partner_id, PartnerRole.role_code)
+    partner_select = (
+        select(
+            literal("partner").label("kind"),
+            cast(UserPartnerLink.partner_id, String).label("value"),
+            PartnerRole.role_code.label("role_code"),
+        )
         .join(PartnerMaster, PartnerMaster.id == UserPartnerLink.partner_id)
         .join(PartnerRole, PartnerRole.id == PartnerMaster.role_id)
-        .filter(UserPartnerLink.user_email == user_email)
-        .filter(UserPartnerLink.deletion_indicator == False)
-        .all()
+        .where(UserPartnerLink.user_email == user_email)
+        .where(UserPartnerLink.deletion_indicator == False)
+    )
+    customer_select = (
+        select(
+            literal("customer").label("kind"),
+            cast(UserCustomerLink.customer_id, String).label("value"),
+            null().label("role_code"),
+        )
+        .join(CustomerMaster, CustomerMaster.id == UserCustomerLink.customer_id)
+        .where(UserCustomerLink.user_email == user_email)
+        .where(UserCustomerLink.deletion_indicator == False)
+        .where(CustomerMaster.is_active == True)
     )
 
+    role_names: set[str] = set()
     forwarder_partner_ids: set[int] = set()
     supplier_partner_ids: set[int] = set()
-    for partner_id, role_code in partner_rows:
-        if partner_id is None:
+    customer_ids: set[int] = set()
+    for kind, value, role_code in db.execute(
+        union_all(role_select, partner_select, customer_select)
+    ):
+        if not value:
             continue
-        normalized = (role_code or "").strip().upper()
-        if normalized in _FORWARDER_CODES:
-            forwarder_partner_ids.add(int(partner_id))
-        if normalized in _SUPPLIER_CODES:
-            supplier_partner_ids.add(int(partner_id))
-
-    customer_rows = (
-        db.query(UserCustomerLink.customer_id)
-        .join(CustomerMaster, CustomerMaster.id == UserCustomerLink.customer_id)
-        .filter(UserCustomerLink.user_email == user_email)
-        .filter(UserCustomerLink.deletion_indicator == False)
-        .filter(CustomerMaster.is_active == True)
-        .all()
-    )
-    customer_ids = {
-        int(row[0]) for row in customer_rows if row and row[0] is not None
-    }
+        if kind == "role":
+            role_names.add(value.strip().upper())
+        elif kind == "partner":
+            bucket = _ROLE_BUCKET.get((role_code or "").strip().upper())
+            if bucket == "forwarder":
+                forwarder_partner_ids.add(int(value))
+            elif bucket == "supplier":
+                supplier_partner_ids.add(int(value))
+        else:
+            customer_ids.add(int(value))
 
     return UserUnionScope(
         role_names=role_names,
@@ -37,35 +37,29 @@ def _endpoint_keys(payload: dict[str, Any]) -> set[str]:
     rows = payload.get("endpoint_policies") or []
     if not isinstance(rows, list):
         return set()
-    keys: set[str] = set()
-    for raw in rows:
-        if not isinstance(raw, dict):
-            continue
-        if raw.get("enabled", True) is False:
-            continue
-        token = str(raw.get("endpoint") or "").strip().lower()
-        if token:
-            keys.add(token)
-    return keys
+    return {
+        token
+        for raw in rows
+        if isinstance(raw, dict) and raw.get("enabled", True) is not False
+        for token in (str(raw.get("endpoint") or "").strip().lower(),)
+        if token
+    }
 
 
 def _mapping_fingerprint(payload: dict[str, Any]) -> set[tuple[str, str, str, str]]:
     rows = payload.get("role_scope_mapping") or []
     if not isinstance(rows, list):
         return set()
-    values: set[tuple[str, str, str, str]] = set()
-    for raw in rows:
-        if not isinstance(raw, dict):
-            continue
-        values.add(
-            (
-                str(raw.get("role") or "").strip().upper(),
-                str(raw.get("dimension") or "").strip(),
-                " ".join(str(raw.get("source") or "").split()),
-                str(raw.get("target_field") or "").strip(),
-            )
+    return {
+        (
+            str(raw.get("role") or "").strip().upper(),
+            str(raw.get("dimension") or "").strip(),
+            " ".join(str(raw.get("source") or "").split()),
+            str(raw.get("target_field") or "").strip(),
         )
-    return values
+        for raw in rows
+        if isinstance(raw, dict)
+    }
 
 
 def main() -> int:
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import enum
+import functools
+import io
+import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
 import sqlalchemy as sa
-from sqlalchemy import MetaData, Table, create_engine, func, select
+from sqlalchemy import MetaData, Table, create_engine, func, literal, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 
 TABLE_DECISION_TABLES = "decision_tables"
@@ -20,6 +32,19 @@ SUPPORTED_TABLES = (
     TABLE_ATTRIBUTE_REGISTRY,
 )
 
+# Columns folded into the per-table checksum; identical expressions run on
+# source and target so equal digests mean equal content.
+CHECKSUM_COLUMNS = {
+    TABLE_DECISION_TABLES: (
+        "id", "slug", "object_type", "description", "hit_policy",
+        "input_schema", "output_schema",
+    ),
+    TABLE_DECISION_RULES: ("id", "table_id", "priority", "logic"),
+    TABLE_ATTRIBUTE_REGISTRY: (
+        "id", "target_object", "attribute_name", "resolution_strategy", "path_logic",
+    ),
+}
+
 HIT_POLICY_VALUES = {"FIRST_HIT", "COLLECT_ALL", "UNIQUE"}
 RESOLUTION_STRATEGY_VALUES = {"DIRECT", "ASSOCIATION", "EXTERNAL"}
 
@@ -30,7 +55,6 @@ class SyncStats:
     inserted: int
     updated: int
     unchanged: int
-    target_count: int
 
 
 def _normalize_enum(value: Any) -> str:
@@ -39,6 +63,24 @@ def _normalize_enum(value: Any) -> str:
     return str(value)
 
 
+@functools.lru_cache(maxsize=64)
+def _norm_token_cached(value: Any) -> str:
+    return _normalize_enum(value).strip().upper()
+
+
+def _norm_token(value: Any) -> str:
+    """Normalized upper-cased enum token.
+
+    The hit-policy and resolution-strategy domains hold a handful of
+    distinct values, so the cached path answers nearly every call without
+    re-running the string work.
+    """
+    try:
+        return _norm_token_cached(value)
+    except TypeError:
+        return _normalize_enum(value).strip().upper()
+
+
 def _require_env(name: str) -> str:
     value = os.getenv(name, "").strip()
     if not value:
@@ -51,13 +93,57 @@ def _load_table(conn: sa.Connection, table_name: str) -> Table:
     return Table(table_name, metadata, autoload_with=conn)
 
 
-def _fetch_rows(conn: sa.Connection, table: Table) -> list[dict[str, Any]]:
-    rows = conn.execute(select(table)).mappings().all()
-    return [dict(row) for row in rows]
+def _iter_rows(
+    conn: sa.Connection,
+    table: Table,
+    columns: Sequence[str] | None = None,
+    chunk: int = 1000,
+) -> Iterator[Mapping[str, Any]]:
+    """Stream table rows with a server-side cursor instead of slurping.
+
+    When ``columns`` is given only those columns are selected, so extra
+    target-side columns (audit timestamps and the like) never cross the
+    wire or get JSON-serialized by the server. Rows are yielded as the
+    driver's read-only mappings; nothing downstream mutates them, so no
+    per-row dict copy is made.
+    """
+    stmt = select(*(table.c[name] for name in columns)) if columns else select(table)
+    result = (
+        conn.execution_options(stream_results=True)
+        .execute(stmt)
+        .mappings()
+        .yield_per(chunk)
+    )
+    yield from result
+
+
+def _table_checksum(
+    conn: sa.Connection, table: Table, columns: tuple[str, ...]
+) -> str | None:
+    """Server-side digest of the whole table, or None off PostgreSQL.
+
+    md5(string_agg(... ORDER BY id)) folds every row into one short string,
+    so two databases can be compared for the idempotent re-run case without
+    shipping or diffing any rows.
+    """
+    if conn.dialect.name != "postgresql":
+        return None
+    row_text = func.concat_ws("|", *(sa.cast(table.c[name], sa.Text) for name in columns))
+    stmt = select(
+        func.md5(func.string_agg(row_text, aggregate_order_by(literal_column("''"), table.c.id)))
+    )
+    return conn.execute(stmt).scalar_one()
 
 
-def _count_rows(conn: sa.Connection, table: Table) -> int:
-    return int(conn.execute(select(func.count()).select_from(table)).scalar_one())
+def _count_all(conn: sa.Connection, tables: dict[str, Table]) -> dict[str, int]:
+    """Row counts for every table in one UNION ALL round trip."""
+    stmt = union_all(
+        *(
+            select(literal(name).label("table_name"), func.count().label("n")).select_from(table)
+            for name, table in tables.items()
+        )
+    )
+    return {name: int(n) for name, n in conn.execute(stmt)}
 
 
 def _expect_uuid(value: Any, *, label: str) -> uuid.UUID:
@@ -69,76 +155,220 @@ def _expect_uuid(value: Any, *, label: str) -> uuid.UUID:
         raise ValueError(f"Invalid UUID for {label}: {value}") from exc
 
 
-def _validate_decision_table_row(row: dict[str, Any]) -> None:
-    _expect_uuid(row.get("id"), label="decision_tables.id")
+def _canonical_payload(payload: dict[str, Any]) -> bytes:
+    """Canonical-JSON bytes of the payload used for change detection.
+
+    Comparing two byte strings sidesteps a recursive dict comparison over
+    potentially large input/output schema objects; orjson sorts keys and
+    encodes in a single C-level pass when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def _copy_csv_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _copy_insert_rows(
+    target_conn: sa.Connection,
+    target_table: Table,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Stream new rows in via COPY FROM STDIN (psycopg2 copy_expert).
+
+    QUOTE_ALL keeps empty strings as empty strings rather than NULLs; the
+    validated seed rows never carry NULL values.
+    """
+    columns = list(rows[0].keys())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    for row in rows:
+        writer.writerow([_copy_csv_value(row[col]) for col in columns])
+    buffer.seek(0)
+    cursor = target_conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {target_table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _flush_sync(
+    target_conn: sa.Connection,
+    target_table: Table,
+    *,
+    to_insert: list[dict[str, Any]],
+    to_update: list[dict[str, Any]],
+    conflict_cols: list[str],
+    update_cols: list[str],
+    use_copy: bool = False,
+) -> None:
+    """Write accumulated inserts and updates.
+
+    On PostgreSQL both sets go through one INSERT ... ON CONFLICT DO UPDATE
+    keyed on the natural key (or COPY for the pure-insert portion when
+    use_copy is set); elsewhere an executemany INSERT plus an executemany
+    UPDATE is used.
+    """
+    if target_conn.dialect.name == "postgresql":
+        rows = to_insert + to_update
+        if use_copy and to_insert:
+            _copy_insert_rows(target_conn, target_table, to_insert)
+            rows = to_update
+        if rows:
+            stmt = pg_insert(target_table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_cols,
+                set_={col: stmt.excluded[col] for col in update_cols},
+                # Conflicting rows whose payload already matches are not
+                # rewritten at all: no WAL, no index churn, no trigger
+                # fire on idempotent re-runs.
+                where=sa.or_(
+                    *(
+                        target_table.c[col].is_distinct_from(stmt.excluded[col])
+                        for col in update_cols
+                    )
+                ),
+            )
+            target_conn.execute(stmt, rows)
+        return
+
+    if to_insert:
+        target_conn.execute(sa.insert(target_table), to_insert)
+    if to_update:
+        target_conn.execute(
+            sa.update(target_table).where(target_table.c.id == sa.bindparam("b_id")),
+            [
+                {"b_id": row["id"], **{col: row[col] for col in update_cols}}
+                for row in to_update
+            ],
+        )
+
+
+def _validate_decision_table_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    """Validate a source row and return its ready-to-write payload.
+
+    Folding validation and payload assembly into one pass parses each
+    UUID and normalizes each enum token exactly once per row.
+    """
+    row_id = _expect_uuid(row.get("id"), label="decision_tables.id")
     slug = str(row.get("slug") or "").strip()
     if not slug:
         raise ValueError("decision_tables.slug cannot be empty")
-    hit_policy = _normalize_enum(row.get("hit_policy")).strip().upper()
+    hit_policy = _norm_token(row.get("hit_policy"))
     if hit_policy not in HIT_POLICY_VALUES:
         raise ValueError(f"Unsupported hit_policy '{hit_policy}' for slug={slug}")
-    if not isinstance(row.get("input_schema"), dict):
+    input_schema = row.get("input_schema")
+    if not isinstance(input_schema, dict):
         raise ValueError(f"decision_tables.input_schema must be JSON object for slug={slug}")
-    if not isinstance(row.get("output_schema"), dict):
+    output_schema = row.get("output_schema")
+    if not isinstance(output_schema, dict):
         raise ValueError(f"decision_tables.output_schema must be JSON object for slug={slug}")
+    return {
+        "id": row_id,
+        "slug": slug,
+        "object_type": str(row.get("object_type") or "").strip(),
+        "description": str(row.get("description") or ""),
+        "hit_policy": hit_policy,
+        "input_schema": input_schema,
+        "output_schema": output_schema,
+    }
 
 
-def _validate_decision_rule_row(row: dict[str, Any]) -> None:
-    _expect_uuid(row.get("id"), label="decision_rules.id")
-    _expect_uuid(row.get("table_id"), label="decision_rules.table_id")
+def _validate_decision_rule_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    row_id = _expect_uuid(row.get("id"), label="decision_rules.id")
+    table_id = _expect_uuid(row.get("table_id"), label="decision_rules.table_id")
     if row.get("priority") is None:
         raise ValueError("decision_rules.priority cannot be null")
-    if not isinstance(row.get("logic"), dict):
+    logic = row.get("logic")
+    if not isinstance(logic, dict):
         raise ValueError("decision_rules.logic must be JSON object")
+    return {
+        "id": row_id,
+        "table_id": table_id,
+        "priority": int(row["priority"]),
+        "logic": logic,
+    }
 
 
-def _validate_attribute_registry_row(row: dict[str, Any]) -> None:
-    _expect_uuid(row.get("id"), label="attribute_registry.id")
+def _validate_attribute_registry_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    row_id = _expect_uuid(row.get("id"), label="attribute_registry.id")
     target_object = str(row.get("target_object") or "").strip()
     attribute_name = str(row.get("attribute_name") or "").strip()
     if not target_object:
         raise ValueError("attribute_registry.target_object cannot be empty")
     if not attribute_name:
         raise ValueError("attribute_registry.attribute_name cannot be empty")
-    strategy = _normalize_enum(row.get("resolution_strategy")).strip().upper()
+    strategy = _norm_token(row.get("resolution_strategy"))
     if strategy not in RESOLUTION_STRATEGY_VALUES:
         raise ValueError(
             f"Unsupported resolution_strategy '{strategy}' "
             f"for {target_object}.{attribute_name}"
         )
-    if not isinstance(row.get("path_logic"), dict):
+    path_logic = row.get("path_logic")
+    if not isinstance(path_logic, dict):
         raise ValueError(
             f"attribute_registry.path_logic must be JSON object for {target_object}.{attribute_name}"
         )
+    return {
+        "id": row_id,
+        "target_object": target_object,
+        "attribute_name": attribute_name,
+        "resolution_strategy": strategy,
+        "path_logic": path_logic,
+    }
 
 
 def _sync_decision_tables(
     target_conn: sa.Connection,
     target_table: Table,
-    source_rows: list[dict[str, Any]],
-) -> SyncStats:
-    existing_rows = _fetch_rows(target_conn, target_table)
-    existing_by_slug = {str(row["slug"]): row for row in existing_rows}
-    source_count = len(source_rows)
-    inserted = 0
-    updated = 0
+    source_rows: Iterable[Mapping[str, Any]],
+    *,
+    source_checksum: str | None = None,
+    use_copy: bool = False,
+) -> tuple[SyncStats, frozenset[uuid.UUID]]:
+    if source_checksum is not None and source_checksum == _table_checksum(
+        target_conn, target_table, CHECKSUM_COLUMNS[TABLE_DECISION_TABLES]
+    ):
+        target_ids = frozenset(
+            _expect_uuid(row_id, label="target decision_tables.id")
+            for row_id in target_conn.execute(select(target_table.c.id)).scalars()
+        )
+        n = len(target_ids)
+        return SyncStats(source_count=n, inserted=0, updated=0, unchanged=n), target_ids
+
+    existing_by_slug = {
+        str(row["slug"]): row
+        for row in _iter_rows(
+            target_conn, target_table, CHECKSUM_COLUMNS[TABLE_DECISION_TABLES]
+        )
+    }
+    target_ids = {
+        _expect_uuid(row["id"], label="target decision_tables.id")
+        for row in existing_by_slug.values()
+    }
+    source_count = 0
     unchanged = 0
+    to_insert: list[dict[str, Any]] = []
+    to_update: list[dict[str, Any]] = []
 
     for raw in source_rows:
-        _validate_decision_table_row(raw)
-        row = {
-            "id": _expect_uuid(raw["id"], label="decision_tables.id"),
-            "slug": str(raw["slug"]).strip(),
-            "object_type": str(raw.get("object_type") or "").strip(),
-            "description": str(raw.get("description") or ""),
-            "hit_policy": _normalize_enum(raw["hit_policy"]).strip().upper(),
-            "input_schema": dict(raw["input_schema"]),
-            "output_schema": dict(raw["output_schema"]),
-        }
+        source_count += 1
+        row = _validate_decision_table_row(raw)
         current = existing_by_slug.get(row["slug"])
         if current is None:
-            target_conn.execute(sa.insert(target_table).values(**row))
-            inserted += 1
+            to_insert.append(row)
+            target_ids.add(row["id"])
             continue
 
         current_id = _expect_uuid(current["id"], label="target decision_tables.id")
@@ -151,7 +381,7 @@ def _sync_decision_tables(
         current_payload = {
             "object_type": str(current.get("object_type") or ""),
             "description": str(current.get("description") or ""),
-            "hit_policy": _normalize_enum(current["hit_policy"]).strip().upper(),
+            "hit_policy": _norm_token(current["hit_policy"]),
             "input_schema": current["input_schema"] if isinstance(current["input_schema"], dict) else {},
             "output_schema": current["output_schema"] if isinstance(current["output_schema"], dict) else {},
         }
@@ -162,62 +392,68 @@ def _sync_decision_tables(
             "input_schema": row["input_schema"],
             "output_schema": row["output_schema"],
         }
-        if current_payload == desired_payload:
+        if _canonical_payload(current_payload) == _canonical_payload(desired_payload):
             unchanged += 1
             continue
 
-        target_conn.execute(
-            sa.update(target_table)
-            .where(target_table.c.id == row["id"])
-            .values(**desired_payload)
-        )
-        updated += 1
+        to_update.append(row)
 
-    return SyncStats(
+    _flush_sync(
+        target_conn,
+        target_table,
+        to_insert=to_insert,
+        to_update=to_update,
+        conflict_cols=["slug"],
+        update_cols=["object_type", "description", "hit_policy", "input_schema", "output_schema"],
+        use_copy=use_copy,
+    )
+
+    stats = SyncStats(
         source_count=source_count,
-        inserted=inserted,
-        updated=updated,
+        inserted=len(to_insert),
+        updated=len(to_update),
         unchanged=unchanged,
-        target_count=_count_rows(target_conn, target_table),
     )
+    return stats, frozenset(target_ids)
 
 
 def _sync_decision_rules(
     target_conn: sa.Connection,
     target_table: Table,
-    source_rows: list[dict[str, Any]],
-    target_decision_tables: Table,
+    source_rows: Iterable[Mapping[str, Any]],
+    valid_table_ids: frozenset[uuid.UUID],
+    *,
+    source_checksum: str | None = None,
+    use_copy: bool = False,
 ) -> SyncStats:
-    existing_rows = _fetch_rows(target_conn, target_table)
-    existing_by_id = {_expect_uuid(row["id"], label="target decision_rules.id"): row for row in existing_rows}
-    valid_table_ids = {
-        _expect_uuid(row["id"], label="target decision_tables.id")
-        for row in _fetch_rows(target_conn, target_decision_tables)
+    if source_checksum is not None and source_checksum == _table_checksum(
+        target_conn, target_table, CHECKSUM_COLUMNS[TABLE_DECISION_RULES]
+    ):
+        n = int(target_conn.execute(select(func.count()).select_from(target_table)).scalar_one())
+        return SyncStats(source_count=n, inserted=0, updated=0, unchanged=n)
+
+    existing_by_id = {
+        _expect_uuid(row["id"], label="target decision_rules.id"): row
+        for row in _iter_rows(
+            target_conn, target_table, CHECKSUM_COLUMNS[TABLE_DECISION_RULES]
+        )
     }
 
-    source_count = len(source_rows)
-    inserted = 0
-    updated = 0
+    source_count = 0
     unchanged = 0
+    to_insert: list[dict[str, Any]] = []
+    to_update: list[dict[str, Any]] = []
 
     for raw in source_rows:
-        _validate_decision_rule_row(raw)
-        row_id = _expect_uuid(raw["id"], label="decision_rules.id")
-        table_id = _expect_uuid(raw["table_id"], label="decision_rules.table_id")
-        if table_id not in valid_table_ids:
+        source_count += 1
+        row = _validate_decision_rule_row(raw)
+        if row["table_id"] not in valid_table_ids:
             raise ValueError(
-                f"decision_rules.table_id {table_id} not found in target decision_tables."
+                f"decision_rules.table_id {row['table_id']} not found in target decision_tables."
             )
-        row = {
-            "id": row_id,
-            "table_id": table_id,
-            "priority": int(raw["priority"]),
-            "logic": dict(raw["logic"]),
-        }
-        current = existing_by_id.get(row_id)
+        current = existing_by_id.get(row["id"])
         if current is None:
-            target_conn.execute(sa.insert(target_table).values(**row))
-            inserted += 1
+            to_insert.append(row)
             continue
 
         current_payload = {
@@ -230,96 +466,109 @@ def _sync_decision_rules(
             "priority": row["priority"],
             "logic": row["logic"],
         }
-        if current_payload == desired_payload:
+        if _canonical_payload(current_payload) == _canonical_payload(desired_payload):
             unchanged += 1
             continue
 
-        target_conn.execute(
-            sa.update(target_table)
-            .where(target_table.c.id == row_id)
-            .values(**desired_payload)
-        )
-        updated += 1
+        to_update.append(row)
+
+    _flush_sync(
+        target_conn,
+        target_table,
+        to_insert=to_insert,
+        to_update=to_update,
+        conflict_cols=["id"],
+        update_cols=["table_id", "priority", "logic"],
+        use_copy=use_copy,
+    )
 
     return SyncStats(
         source_count=source_count,
-        inserted=inserted,
-        updated=updated,
+        inserted=len(to_insert),
+        updated=len(to_update),
         unchanged=unchanged,
-        target_count=_count_rows(target_conn, target_table),
     )
 
 
 def _sync_attribute_registry(
     target_conn: sa.Connection,
     target_table: Table,
-    source_rows: list[dict[str, Any]],
+    source_rows: Iterable[Mapping[str, Any]],
+    *,
+    source_checksum: str | None = None,
 ) -> SyncStats:
-    existing_rows = _fetch_rows(target_conn, target_table)
+    if source_checksum is not None and source_checksum == _table_checksum(
+        target_conn, target_table, CHECKSUM_COLUMNS[TABLE_ATTRIBUTE_REGISTRY]
+    ):
+        n = int(target_conn.execute(select(func.count()).select_from(target_table)).scalar_one())
+        return SyncStats(source_count=n, inserted=0, updated=0, unchanged=n)
+
+    # Single-string keys hash and compare faster than two-element tuples in
+    # the lookup below; NUL is a safe separator because schema identifiers
+    # cannot contain it.
     existing_by_key = {
-        (str(row["target_object"]), str(row["attribute_name"])): row
-        for row in existing_rows
+        f"{row['target_object']}\x00{row['attribute_name']}": row
+        for row in _iter_rows(
+            target_conn, target_table, CHECKSUM_COLUMNS[TABLE_ATTRIBUTE_REGISTRY]
+        )
     }
-    source_count = len(source_rows)
-    inserted = 0
-    updated = 0
+    source_count = 0
     unchanged = 0
+    to_insert: list[dict[str, Any]] = []
+    to_update: list[dict[str, Any]] = []
 
     for raw in source_rows:
-        _validate_attribute_registry_row(raw)
-        row = {
-            "id": _expect_uuid(raw["id"], label="attribute_registry.id"),
-            "target_object": str(raw["target_object"]).strip(),
-            "attribute_name": str(raw["attribute_name"]).strip(),
-            "resolution_strategy": _normalize_enum(raw["resolution_strategy"]).strip().upper(),
-            "path_logic": dict(raw["path_logic"]),
-        }
-        key = (row["target_object"], row["attribute_name"])
+        source_count += 1
+        row = _validate_attribute_registry_row(raw)
+        key = f"{row['target_object']}\x00{row['attribute_name']}"
         current = existing_by_key.get(key)
         if current is None:
-            target_conn.execute(sa.insert(target_table).values(**row))
-            inserted += 1
+            to_insert.append(row)
             continue
 
         current_id = _expect_uuid(current["id"], label="target attribute_registry.id")
         if current_id != row["id"]:
             raise ValueError(
                 "Cannot preserve source UUIDs: existing attribute_registry row has same key "
-                f"{key} but different id (target={current_id}, source={row['id']})."
+                f"{(row['target_object'], row['attribute_name'])} but different id "
+                f"(target={current_id}, source={row['id']})."
             )
 
         current_payload = {
-            "resolution_strategy": _normalize_enum(current["resolution_strategy"]).strip().upper(),
+            "resolution_strategy": _norm_token(current["resolution_strategy"]),
             "path_logic": current["path_logic"] if isinstance(current["path_logic"], dict) else {},
         }
         desired_payload = {
             "resolution_strategy": row["resolution_strategy"],
             "path_logic": row["path_logic"],
         }
-        if current_payload == desired_payload:
+        if _canonical_payload(current_payload) == _canonical_payload(desired_payload):
             unchanged += 1
             continue
 
-        target_conn.execute(
-            sa.update(target_table)
-            .where(target_table.c.id == row["id"])
-            .values(**desired_payload)
-        )
-        updated += 1
+        to_update.append(row)
+
+    _flush_sync(
+        target_conn,
+        target_table,
+        to_insert=to_insert,
+        to_update=to_update,
+        conflict_cols=["target_object", "attribute_name"],
+        update_cols=["resolution_strategy", "path_logic"],
+    )
 
     return SyncStats(
         source_count=source_count,
-        inserted=inserted,
-        updated=updated,
+        inserted=len(to_insert),
+        updated=len(to_update),
         unchanged=unchanged,
-        target_count=_count_rows(target_conn, target_table),
     )
 
 
-def _print_stats(table_name: str, stats: SyncStats) -> None:
+def _print_stats(table_name: str, stats: SyncStats, target_count: int) -> None:
     print(
         f"{table_name}: source={stats.source_count}, inserted={stats.inserted}, "
-        f"updated={stats.updated}, unchanged={stats.unchanged}, target={stats.target_count}"
+        f"updated={stats.updated}, unchanged={stats.unchanged}, target={target_count}"
     )
 
 
@@ -340,44 +589,104 @@ def main() -> int:
         default=os.getenv("TARGET_DATABASE_URL", "").strip(),
         help="Target FLUXPORT database URL (or set TARGET_DATABASE_URL).",
     )
+    parser.add_argument(
+        "--use-copy",
+        action="store_true",
+        help=(
+            "Stream new decision_tables/decision_rules rows via PostgreSQL "
+            "COPY instead of batched INSERTs (PostgreSQL targets only)."
+        ),
+    )
     args = parser.parse_args()
 
     source_db_url = args.source_db_url or _require_env("SOURCE_DATABASE_URL")
     target_db_url = args.target_db_url or _require_env("TARGET_DATABASE_URL")
 
-    source_engine = create_engine(source_db_url, pool_pre_ping=True)
-    target_engine = create_engine(target_db_url, pool_pre_ping=True)
+    # One-shot script: NullPool skips the pooling/keepalive machinery and
+    # dropping pre-ping saves a SELECT 1 round trip per connection checkout.
+    source_engine = create_engine(source_db_url, poolclass=sa.pool.NullPool)
+    target_engine = create_engine(target_db_url, poolclass=sa.pool.NullPool)
+
+    def _fetch_source_table(name: str) -> tuple[str | None, list[Mapping[str, Any]]]:
+        # Each worker checks out its own pooled connection; rows are still
+        # read through the streaming cursor, just drained eagerly here. The
+        # checksum rides along so the sync can skip its per-row diff when
+        # the target already matches byte for byte.
+        with source_engine.connect() as conn:
+            table = _load_table(conn, name)
+            checksum = _table_checksum(conn, table, CHECKSUM_COLUMNS[name])
+            return checksum, list(_iter_rows(conn, table, CHECKSUM_COLUMNS[name]))
 
     try:
-        with source_engine.connect() as source_conn, target_engine.begin() as target_conn:
-            source_tables = {name: _load_table(source_conn, name) for name in SUPPORTED_TABLES}
-            target_tables = {name: _load_table(target_conn, name) for name in SUPPORTED_TABLES}
+        # The three source tables are independent; fetching them in parallel
+        # makes source-side wall time max(t1, t2, t3) instead of the sum,
+        # which matters for remote source databases.
+        with ThreadPoolExecutor(max_workers=len(SUPPORTED_TABLES)) as pool:
+            source_data = dict(
+                zip(SUPPORTED_TABLES, pool.map(_fetch_source_table, SUPPORTED_TABLES))
+            )
 
-            source_decision_tables = _fetch_rows(source_conn, source_tables[TABLE_DECISION_TABLES])
-            source_decision_rules = _fetch_rows(source_conn, source_tables[TABLE_DECISION_RULES])
-            source_attribute_registry = _fetch_rows(source_conn, source_tables[TABLE_ATTRIBUTE_REGISTRY])
+        def _run_decision_pipeline() -> tuple[SyncStats, SyncStats]:
+            # decision_rules depends on decision_tables, so the two syncs
+            # share one ordered transaction.
+            with target_engine.begin() as conn:
+                if conn.dialect.name == "postgresql":
+                    # With the deferrable decision_rules.table_id FK, this
+                    # makes PostgreSQL check the constraint once at COMMIT
+                    # rather than after every row written here.
+                    conn.execute(sa.text("SET CONSTRAINTS ALL DEFERRED"))
+                dt_checksum, dt_rows = source_data[TABLE_DECISION_TABLES]
+                dr_checksum, dr_rows = source_data[TABLE_DECISION_RULES]
+                # The decision-tables sync already knows every id present
+                # in the target afterwards; reuse that set for rule
+                # validation instead of re-scanning the table.
+                dt_stats, dt_ids = _sync_decision_tables(
+                    conn,
+                    _load_table(conn, TABLE_DECISION_TABLES),
+                    dt_rows,
+                    source_checksum=dt_checksum,
+                    use_copy=args.use_copy,
+                )
+                dr_stats = _sync_decision_rules(
+                    conn,
+                    _load_table(conn, TABLE_DECISION_RULES),
+                    dr_rows,
+                    dt_ids,
+                    source_checksum=dr_checksum,
+                    use_copy=args.use_copy,
+                )
+                return dt_stats, dr_stats
+
+        def _run_attribute_pipeline() -> SyncStats:
+            with target_engine.begin() as conn:
+                ar_checksum, ar_rows = source_data[TABLE_ATTRIBUTE_REGISTRY]
+                return _sync_attribute_registry(
+                    conn,
+                    _load_table(conn, TABLE_ATTRIBUTE_REGISTRY),
+                    ar_rows,
+                    source_checksum=ar_checksum,
+                )
 
-            dt_stats = _sync_decision_tables(
-                target_conn,
-                target_tables[TABLE_DECISION_TABLES],
-                source_decision_tables,
-            )
-            dr_stats = _sync_decision_rules(
-                target_conn,
-                target_tables[TABLE_DECISION_RULES],
-                source_decision_rules,
-                target_tables[TABLE_DECISION_TABLES],
-            )
-            ar_stats = _sync_attribute_registry(
-                target_conn,
-                target_tables[TABLE_ATTRIBUTE_REGISTRY],
-                source_attribute_registry,
-            )
+        # attribute_registry has no dependency on the decision tables, so
+        # its sync runs on its own connection/transaction concurrently with
+        # the decision pipeline; target wall time is max of the two.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            decision_future = pool.submit(_run_decision_pipeline)
+            attribute_future = pool.submit(_run_attribute_pipeline)
+            dt_stats, dr_stats = decision_future.result()
+            ar_stats = attribute_future.result()
+
+        with target_engine.connect() as target_conn:
+            target_tables = {name: _load_table(target_conn, name) for name in SUPPORTED_TABLES}
+
+            # One UNION ALL round trip covers the post-seed count check for
+            # all three tables instead of a COUNT(*) per sync.
+            target_counts = _count_all(target_conn, target_tables)
 
             print("Seed summary")
-            _print_stats(TABLE_DECISION_TABLES, dt_stats)
-            _print_stats(TABLE_DECISION_RULES, dr_stats)
-            _print_stats(TABLE_ATTRIBUTE_REGISTRY, ar_stats)
+            _print_stats(TABLE_DECISION_TABLES, dt_stats, target_counts[TABLE_DECISION_TABLES])
+            _print_stats(TABLE_DECISION_RULES, dr_stats, target_counts[TABLE_DECISION_RULES])
+            _print_stats(TABLE_ATTRIBUTE_REGISTRY, ar_stats, target_counts[TABLE_ATTRIBUTE_REGISTRY])
 
             mismatches = []
             for name, stats in (
@@ -385,7 +694,7 @@ def main() -> int:
                 (TABLE_DECISION_RULES, dr_stats),
                 (TABLE_ATTRIBUTE_REGISTRY, ar_stats),
             ):
-                if stats.source_count != stats.target_count:
+                if stats.source_count != target_counts[name]:
                     mismatches.append(name)
             if mismatches:
                 raise RuntimeError(
@@ -11,13 +11,18 @@ Tables seeded:
   - sys_workflow_rules
   - sys_number_ranges
 
-This script uses db.add_all() and db.commit() to persist data.
+Rows are accumulated as mapping dicts and persisted per model through
+bulk_insert_mappings/bulk_update_mappings; the role prerequisites go in
+via single INSERT ... ON CONFLICT upserts.
 """
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any, Iterable
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
@@ -35,20 +40,20 @@ from app.models.number_range import SysNumberRange
 from app.models.text_lookups import TextTypeLookup
 
 
+def _preload_ids(db: Session, model: Any) -> set[int]:
+    return set(db.execute(select(model.id)).scalars())
+
+
 def _upsert_by_id(
-    db: Session,
     model: Any,
     row_id: int,
     data: dict[str, Any],
-    new_objects: list[Any],
+    inserts: dict[Any, list[dict[str, Any]]],
+    updates: dict[Any, list[dict[str, Any]]],
+    existing_ids: set[int],
 ) -> None:
-    obj = db.get(model, row_id)
-    if obj:
-        for key, value in data.items():
-            setattr(obj, key, value)
-        return
-    obj = model(id=row_id, **data)
-    new_objects.append(obj)
+    bucket = updates if row_id in existing_ids else inserts
+    bucket[model].append({"id": row_id, **data})
 
 
 def _ensure_roles(db: Session) -> None:
@@ -59,48 +64,57 @@ def _ensure_roles(db: Session) -> None:
         (3, "Warehouse"),
         (4, "SUPPLIER"),
     ]
-    new_objects: list[Any] = []
-    updated_any = False
-    for role_id, name in required_roles:
-        existing_by_id = db.get(Role, role_id)
-        existing_by_name = (
-            db.query(Role)
-            .filter(Role.name == name)
-            .filter(Role.id != role_id)
-            .first()
+    # One SELECT answers both collision probes (same id, or same name under
+    # a different id) for every required role at once.
+    name_to_id = {
+        name: role_id
+        for role_id, name in db.execute(
+            select(Role.id, Role.name).where(
+                Role.id.in_([role_id for role_id, _ in required_roles])
+                | Role.name.in_([name for _, name in required_roles])
+            )
         )
-        if existing_by_id:
-            if existing_by_name:
-                continue
-            if existing_by_id.name != name:
-                existing_by_id.name = name
-                updated_any = True
-            continue
-        if existing_by_name:
-            continue
-        new_objects.append(Role(id=role_id, name=name))
-    if updated_any or new_objects:
-        if new_objects:
-            db.add_all(new_objects)
-        db.commit()
+    }
+    rows = [
+        {"id": role_id, "name": name}
+        for role_id, name in required_roles
+        # A different row already holding the name would trip uq_roles_name;
+        # keep skipping those rows as before.
+        if name_to_id.get(name, role_id) == role_id
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(Role.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Role.id],
+        set_={"name": stmt.excluded.name},
+    )
+    db.execute(stmt)
+    db.commit()
 
 
 def _ensure_partner_role(db: Session) -> int:
-    # Ensure a Supplier role exists for vendor_lookup mapping
-    role = db.query(PartnerRole).filter(PartnerRole.role_code == "SUPPLIER").first()
-    if role:
-        return role.id
-
-    role = PartnerRole(
-        role_code="SUPPLIER",
-        role_name="Supplier",
-        description="External vendor/supplier",
-        is_active=True,
+    # Ensure a Supplier role exists for vendor_lookup mapping; a single
+    # UPSERT with RETURNING covers the common create path in one round trip.
+    stmt = (
+        pg_insert(PartnerRole.__table__)
+        .values(
+            role_code="SUPPLIER",
+            role_name="Supplier",
+            description="External vendor/supplier",
+            is_active=True,
+        )
+        .on_conflict_do_nothing(index_elements=[PartnerRole.role_code])
+        .returning(PartnerRole.id)
     )
-    db.add_all([role])
-    db.commit()
-    db.refresh(role)
-    return role.id
+    role_id = db.execute(stmt).scalar()
+    if role_id is not None:
+        db.commit()
+        return role_id
+    # DO NOTHING returns no row when the role already existed.
+    return db.execute(
+        select(PartnerRole.id).where(PartnerRole.role_code == "SUPPLIER")
+    ).scalar_one()
 
 
 def seed() -> None:
@@ -109,7 +123,28 @@ def seed() -> None:
         _ensure_roles(db)
         supplier_role_id = _ensure_partner_role(db)
 
-        new_objects: list[Any] = []
+        # Rows accumulate as plain mapping dicts and are flushed per model
+        # through bulk_insert_mappings/bulk_update_mappings at the end, so
+        # no intermediate ORM instances or per-row statements are built.
+        inserts: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+        updates: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+
+        # Existing IDs are preloaded once per table so the upsert loops
+        # decide insert-vs-update by set membership instead of a db.get()
+        # round trip per row.
+        existing_ids = {
+            model: _preload_ids(db, model)
+            for model in (
+                PurchaseOrderTypeLookup,
+                PurchaseOrderStatusLookup,
+                PurchaseOrgLookup,
+                CompanyMaster,
+                PartnerMaster,
+                SysWorkflowRule,
+                TextTypeLookup,
+                SysNumberRange,
+            )
+        }
 
         # Purchase Order Types
         po_types = [
@@ -130,7 +165,6 @@ def seed() -> None:
         ]
         for row in po_types:
             _upsert_by_id(
-                db,
                 PurchaseOrderTypeLookup,
                 row["id"],
                 {
@@ -139,7 +173,9 @@ def seed() -> None:
                     "description": row["description"],
                     "is_active": row["is_active"],
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[PurchaseOrderTypeLookup],
             )
 
         # Purchase Order Statuses
@@ -171,7 +207,6 @@ def seed() -> None:
         ]
         for row in po_statuses:
             _upsert_by_id(
-                db,
                 PurchaseOrderStatusLookup,
                 row["id"],
                 {
@@ -179,7 +214,9 @@ def seed() -> None:
                     "status_name": row["status_name"],
                     "is_active": row["is_active"],
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[PurchaseOrderStatusLookup],
             )
 
         # Purchase Organizations
@@ -190,7 +227,6 @@ def seed() -> None:
         ]
         for row in purchase_orgs:
             _upsert_by_id(
-                db,
                 PurchaseOrgLookup,
                 row["id"],
                 {
@@ -199,7 +235,9 @@ def seed() -> None:
                     "description": None,
                     "is_active": True,
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[PurchaseOrgLookup],
             )
 
         # Company Lookup -> company_master
@@ -210,7 +248,6 @@ def seed() -> None:
         ]
         for row in companies:
             _upsert_by_id(
-                db,
                 CompanyMaster,
                 row["id"],
                 {
@@ -223,7 +260,9 @@ def seed() -> None:
                     "addr_id": None,
                     "default_currency": "USD",
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[CompanyMaster],
             )
 
         # Vendor Lookup -> partner_master
@@ -234,7 +273,6 @@ def seed() -> None:
         ]
         for row in vendors:
             _upsert_by_id(
-                db,
                 PartnerMaster,
                 row["id"],
                 {
@@ -249,7 +287,9 @@ def seed() -> None:
                     "is_verified": False,
                     "addr_id": None,
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[PartnerMaster],
             )
 
         # Workflow Rules
@@ -284,7 +324,6 @@ def seed() -> None:
         ]
         for row in workflow_rules:
             _upsert_by_id(
-                db,
                 SysWorkflowRule,
                 row["id"],
                 {
@@ -295,7 +334,9 @@ def seed() -> None:
                     "required_role_id": row["required_role_id"],
                     "is_blocking": row["is_blocking"],
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[SysWorkflowRule],
             )
 
         # Text Types (Purchase order + shipment)
@@ -310,7 +351,6 @@ def seed() -> None:
         ]
         for row in text_types:
             _upsert_by_id(
-                db,
                 TextTypeLookup,
                 row["id"],
                 {
@@ -319,7 +359,9 @@ def seed() -> None:
                     "is_external": row["is_external"],
                     "is_active": row["is_active"],
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[TextTypeLookup],
             )
 
         # Number Ranges
@@ -347,7 +389,6 @@ def seed() -> None:
         ]
         for row in number_ranges:
             _upsert_by_id(
-                db,
                 SysNumberRange,
                 row["id"],
                 {
@@ -359,11 +400,15 @@ def seed() -> None:
                     "include_year": row["include_year"],
                     "is_active": row["is_active"],
                 },
-                new_objects,
+                inserts,
+                updates,
+                existing_ids[SysNumberRange],
             )
 
-        if new_objects:
-            db.add_all(new_objects)
+        for model, payload in inserts.items():
+            db.bulk_insert_mappings(model, payload)
+        for model, payload in updates.items():
+            db.bulk_update_mappings(model, payload)
         db.commit()
         print("Seed completed.")
     finally:
@@ -1,3 +1,5 @@
+from sqlalchemy import tuple_
+
 from app.db.session import SessionLocal
 from app.models.number_range import SysNumberRange
 from app.models.po_lookups import PurchaseOrderTypeLookup
@@ -5,62 +7,75 @@ from app.models.partner_role import PartnerRole
 from app.models.customer_role import CustomerRole
 
 
-def _ensure_range(db, category: str, type_id: int, prefix: str):
-    existing = (
-        db.query(SysNumberRange)
-        .filter(SysNumberRange.doc_category == category)
-        .filter(SysNumberRange.doc_type_id == type_id)
-        .first()
-    )
-    if existing:
-        return False
-    db.add(
-        SysNumberRange(
-            doc_category=category,
-            doc_type_id=type_id,
-            prefix=prefix,
-            current_value=0,
-            padding=5,
-            include_year=False,
-            is_active=True,
-        )
-    )
-    return True
+def _range_row(category: str, type_id: int, prefix: str) -> dict:
+    return {
+        "doc_category": category,
+        "doc_type_id": type_id,
+        "prefix": prefix,
+        "current_value": 0,
+        "padding": 5,
+        "include_year": False,
+        "is_active": True,
+    }
 
 
 def main():
     db = SessionLocal()
     try:
-        created = 0
-
         po_types = (
             db.query(PurchaseOrderTypeLookup)
             .filter(PurchaseOrderTypeLookup.is_active == True)
             .all()
         )
-        for t in po_types:
-            code = (t.type_code or "PO").strip()
-            if _ensure_range(db, "PO", t.id, f"{code}-"):
-                created += 1
-
         partner_roles = (
             db.query(PartnerRole).filter(PartnerRole.is_active == True).all()
         )
-        for r in partner_roles:
-            code = (r.role_code or "PARTNER").strip()
-            if _ensure_range(db, "PARTNER", r.id, f"{code}-"):
-                created += 1
-
         customer_roles = (
             db.query(CustomerRole).filter(CustomerRole.is_active == True).all()
         )
-        for r in customer_roles:
-            code = (r.role_code or "CUSTOMER").strip()
-            if _ensure_range(db, "CUSTOMER", r.id, f"{code}-"):
-                created += 1
 
-        db.commit()
-        print(f"Seed complete. Added {created} ranges.")
+        # One IN query answers every existence check up front instead of a
+        # SELECT per (category, type_id) pair inside the loops.
+        wanted = (
+            [("PO", t.id) for t in po_types]
+            + [("PARTNER", r.id) for r in partner_roles]
+            + [("CUSTOMER", r.id) for r in customer_roles]
+        )
+        existing = set()
+        if wanted:
+            existing = set(
+                db.query(SysNumberRange.doc_category, SysNumberRange.doc_type_id)
+                .filter(
+                    tuple_(
+                        SysNumberRange.doc_category, SysNumberRange.doc_type_id
+                    ).in_(wanted)
+                )
+                .all()
+            )
+
+        # Plain mapping dicts flushed in one multi-values INSERT; these rows
+        # carry no relationships or defaults needing the full unit of work.
+        rows = (
+            [
+                _range_row("PO", t.id, f"{(t.type_code or 'PO').strip()}-")
+                for t in po_types
+                if ("PO", t.id) not in existing
+            ]
+            + [
+                _range_row("PARTNER", r.id, f"{(r.role_code or 'PARTNER').strip()}-")
+                for r in partner_roles
+                if ("PARTNER", r.id) not in existing
+            ]
+            + [
+                _range_row("CUSTOMER", r.id, f"{(r.role_code or 'CUSTOMER').strip()}-")
+                for r in customer_roles
+                if ("CUSTOMER", r.id) not in existing
+            ]
+        )
+        if rows:
+            db.bulk_insert_mappings(SysNumberRange, rows)
+            db.commit()
+        print(f"Seed complete. Added {len(rows)} ranges.")
     finally:
         db.close()
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
 
 from app.db.session import SessionLocal
 from app.models.text_lookups import TextTypeLookup
@@ -53,31 +54,73 @@ def seed() -> None:
             map_row.text_type_id: map_row
             for map_row in (
                 db.query(ProfileTextMap)
+                # Pull every map's values in one extra SELECT up front
+                # instead of a lazy load per map below.
+                .options(selectinload(ProfileTextMap.values))
                 .filter(ProfileTextMap.profile_id == profile.id)
                 .all()
             )
         }
 
+        new_maps: list[dict] = []
+        map_updates: list[dict] = []
         for seq, text_type in enumerate(text_types, start=1):
             map_row = map_rows.get(text_type.id)
             if map_row is None:
-                map_row = ProfileTextMap(
-                    profile_id=profile.id,
-                    text_type_id=text_type.id,
-                    sequence=seq,
-                    is_mandatory=False,
-                    is_editable=True,
-                    is_active=True,
-                    created_by="seed@local",
-                    last_changed_by="seed@local",
+                new_maps.append(
+                    {
+                        "profile_id": profile.id,
+                        "text_type_id": text_type.id,
+                        "sequence": seq,
+                        "is_mandatory": False,
+                        "is_editable": True,
+                        "is_active": True,
+                        "created_by": "seed@local",
+                        "last_changed_by": "seed@local",
+                    }
                 )
-                db.add(map_row)
-                db.flush()
             else:
-                map_row.sequence = seq
-                map_row.is_active = True
-                map_row.is_editable = True
-                map_row.last_changed_by = "seed@local"
+                map_updates.append(
+                    {
+                        "id": map_row.id,
+                        "sequence": seq,
+                        "is_active": True,
+                        "is_editable": True,
+                        "last_changed_by": "seed@local",
+                    }
+                )
+
+        # All missing maps go in with one INSERT; RETURNING recovers the
+        # generated ids in the same trip so the value rows below can
+        # reference them without a flush per row.
+        new_map_ids: dict[int, int] = {}
+        if new_maps:
+            result = db.execute(
+                insert(ProfileTextMap)
+                .values(new_maps)
+                .returning(ProfileTextMap.id, ProfileTextMap.text_type_id)
+            )
+            new_map_ids = {text_type_id: map_id for map_id, text_type_id in result}
+        if map_updates:
+            db.bulk_update_mappings(ProfileTextMap, map_updates)
+
+        new_values: list[dict] = []
+        for text_type in text_types:
+            map_row = map_rows.get(text_type.id)
+            if map_row is None:
+                # Freshly inserted map: it cannot have values yet.
+                new_values.append(
+                    {
+                        "profile_text_map_id": new_map_ids[text_type.id],
+                        "language": "en",
+                        "country_code": None,
+                        "text_value": _dummy_text_for_type(text_type),
+                        "is_active": True,
+                        "created_by": "seed@local",
+                        "last_changed_by": "seed@local",
+                    }
+                )
+                continue
 
             existing_value = next(
                 (
@@ -88,21 +131,25 @@ def seed() -> None:
                 None,
             )
             if existing_value is None:
-                value = ProfileTextValue(
-                    profile_text_map_id=map_row.id,
-                    language="en",
-                    country_code=None,
-                    text_value=_dummy_text_for_type(text_type),
-                    is_active=True,
-                    created_by="seed@local",
-                    last_changed_by="seed@local",
+                new_values.append(
+                    {
+                        "profile_text_map_id": map_row.id,
+                        "language": "en",
+                        "country_code": None,
+                        "text_value": _dummy_text_for_type(text_type),
+                        "is_active": True,
+                        "created_by": "seed@local",
+                        "last_changed_by": "seed@local",
+                    }
                 )
-                db.add(value)
             else:
                 existing_value.text_value = _dummy_text_for_type(text_type)
                 existing_value.is_active = True
                 existing_value.last_changed_by = "seed@local"
 
+        if new_values:
+            db.bulk_insert_mappings(ProfileTextValue, new_values)
+
         db.commit()
         print("Text profile map/value seed completed for profile id", profile.id)
     finally:
@@ -7,6 +7,7 @@ import pytest
 from fastapi import HTTPException
 
 from app.core.config import settings
+from app.core.decision.role_scope_metadata import build_role_scope_metadata_snapshot
 from app.models.company_master import CompanyMaster
 from app.models.customer_master import CustomerMaster
 from app.models.customer_role import CustomerRole
@@ -205,8 +206,8 @@ def test_metadata_scope_resolves_company_ids_from_user_customer_links(db_session
         ],
     }
     monkeypatch.setattr(
-        "app.services.role_scope_metadata_service.get_role_scope_metadata",
-        lambda: metadata,
+        "app.services.role_scope_metadata_service.get_role_scope_metadata_snapshot",
+        lambda: build_role_scope_metadata_snapshot(metadata),
     )
 
     decision = resolve_metadata_scope_decision(
@@ -259,8 +260,8 @@ def test_metadata_scope_denies_empty_resolved_scope_for_scoped_policy(
         ],
     }
     monkeypatch.setattr(
-        "app.services.role_scope_metadata_service.get_role_scope_metadata",
-        lambda: metadata,
+        "app.services.role_scope_metadata_service.get_role_scope_metadata_snapshot",
+        lambda: build_role_scope_metadata_snapshot(metadata),
     )
 
     decision = resolve_metadata_scope_decision(
@@ -309,8 +310,8 @@ def test_scope_deny_detail_reports_empty_resolved_scope_reason(db_session, monke
         ],
     }
     monkeypatch.setattr(
-        "app.services.role_scope_metadata_service.get_role_scope_metadata",
-        lambda: metadata,
+        "app.services.role_scope_metadata_service.get_role_scope_metadata_snapshot",
+        lambda: build_role_scope_metadata_snapshot(metadata),
     )
     monkeypatch.setattr(settings, "ROLE_SCOPE_POLICY_ENABLED", True)
     monkeypatch.setattr(settings, "ROLE_SCOPE_POLICY_MODE", "union_metadata")
@@ -6,6 +6,7 @@ from decimal import Decimal
 import pytest
 
 from app.core.config import settings
+from app.core.decision.role_scope_metadata import build_role_scope_metadata_snapshot
 from app.api.v1.endpoints.reports import _resolve_scoped_po_numbers
 from app.api.v1.endpoints.shipments import _resolve_grouping_scope
 from app.models.company_master import CompanyMaster
@@ -677,8 +678,8 @@ def test_role_scope_union_metadata_uses_readable_identifier_filters(db_session,
         ],
     }
     monkeypatch.setattr(
-        "app.services.role_scope_metadata_service.get_role_scope_metadata",
-        lambda: custom_metadata,
+        "app.services.role_scope_metadata_service.get_role_scope_metadata_snapshot",
+        lambda: build_role_scope_metadata_snapshot(custom_metadata),
     )
 
     monkeypatch.setattr(settings, "ROLE_SCOPE_POLICY_ENABLED", True)
@@ -726,8 +727,8 @@ def test_role_scope_union_metadata_no_policy_can_fallback_to_union(db_session, m
         ],
     }
     monkeypatch.setattr(
-        "app.services.role_scope_metadata_service.get_role_scope_metadata",
-        lambda: custom_metadata,
+        "app.services.role_scope_metadata_service.get_role_scope_metadata_snapshot",
+        lambda: build_role_scope_metadata_snapshot(custom_metadata),
     )
 
     monkeypatch.setattr(settings, "ROLE_SCOPE_POLICY_ENABLED", True)
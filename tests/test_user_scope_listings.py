@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import pytest
+
+from app.models.company_master import CompanyMaster
+from app.models.customer_master import CustomerMaster
+from app.models.customer_role import CustomerRole
+from app.models.partner_master import PartnerMaster
+from app.models.partner_role import PartnerRole
+from app.models.user_customer_link import UserCustomerLink
+from app.models.user_partner_link import UserPartnerLink
+from app.models.users import User
+from app.services.user_scope_service import list_user_customers, list_user_partners
+
+
+@pytest.fixture()
+def seeded_links(db_session):
+    db = db_session
+    db.add_all(
+        [
+            User(
+                id=1,
+                username="linked",
+                email="linked@example.com",
+                is_active=True,
+                clearance=0,
+            ),
+        ]
+    )
+    db.add_all(
+        [
+            PartnerRole(id=1, role_code="FO", role_name="Forwarder", is_active=True),
+            PartnerRole(id=2, role_code="SU", role_name="Supplier", is_active=True),
+            CustomerRole(id=1, role_code="B2B", role_name="B2B", is_active=True),
+        ]
+    )
+    db.add_all(
+        [
+            PartnerMaster(
+                id=11,
+                partner_identifier="FO-0011",
+                role_id=1,
+                legal_name="Forwarder Legal",
+                trade_name="Forwarder Trade",
+                preferred_currency="USD",
+                is_active=True,
+                is_verified=True,
+            ),
+            PartnerMaster(
+                id=21,
+                partner_identifier="SU-0021",
+                role_id=2,
+                legal_name="Supplier Legal",
+                preferred_currency="USD",
+                is_active=True,
+                is_verified=True,
+            ),
+        ]
+    )
+    db.add_all(
+        [
+            CompanyMaster(
+                id=31,
+                company_code="COMP-31",
+                branch_code="HQ",
+                legal_name="Company 31",
+                tax_id="TAX-31",
+                default_currency="USD",
+                is_active=True,
+            ),
+        ]
+    )
+    db.add_all(
+        [
+            CustomerMaster(
+                id=31,
+                customer_identifier="CUST-0031",
+                role_id=1,
+                company_id=31,
+                legal_name="Customer Legal",
+                preferred_currency="USD",
+                is_active=True,
+                is_verified=True,
+                created_by="seed@local",
+                last_changed_by="seed@local",
+            ),
+            CustomerMaster(
+                id=32,
+                customer_identifier="CUST-0032",
+                role_id=1,
+                legal_name="Customer 32",
+                preferred_currency="USD",
+                is_active=True,
+                is_verified=True,
+                created_by="seed@local",
+                last_changed_by="seed@local",
+            ),
+        ]
+    )
+    db.add_all(
+        [
+            UserPartnerLink(
+                user_email="linked@example.com",
+                partner_id=11,
+                deletion_indicator=False,
+            ),
+            UserPartnerLink(
+                user_email="linked@example.com",
+                partner_id=21,
+                deletion_indicator=False,
+            ),
+            UserCustomerLink(
+                user_email="linked@example.com",
+                customer_id=31,
+                deletion_indicator=False,
+            ),
+            # Soft-deleted link must never surface in the listing.
+            UserCustomerLink(
+                user_email="linked@example.com",
+                customer_id=32,
+                deletion_indicator=True,
+            ),
+        ]
+    )
+    db.commit()
+    return db
+
+
+def test_list_user_customers_executes_and_maps_names(seeded_links):
+    rows = list_user_customers(seeded_links, "linked@example.com")
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["id"] == 31
+    # No trade_name on the customer, so the name falls back to legal_name.
+    assert row["name"] == "Customer Legal"
+    assert row["code"] == "CUST-0031"
+    assert row["company_id"] == 31
+    assert row["company_name"] == "Company 31"
+
+
+def test_list_user_partners_executes_and_maps_names(seeded_links):
+    rows = list_user_partners(seeded_links, "linked@example.com")
+    by_id = {row["id"]: row for row in rows}
+    assert set(by_id) == {11, 21}
+    # trade_name wins when present, legal_name otherwise.
+    assert by_id[11]["name"] == "Forwarder Trade"
+    assert by_id[21]["name"] == "Supplier Legal"
+    assert by_id[11]["role_code"] == "FO"
+    assert by_id[21]["role_name"] == "Supplier"
+
+
+def test_listings_empty_for_unlinked_user(seeded_links):
+    assert list_user_customers(seeded_links, "nobody@example.com") == []
+    assert list_user_partners(seeded_links, "nobody@example.com") == []